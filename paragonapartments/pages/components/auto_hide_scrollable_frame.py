@@ -36,6 +36,7 @@ class AutoHideScrollableFrame(CTkScrollableFrame):
             **kwargs: Additional arguments passed to CTkScrollableFrame
         """
         self._scroll_speed = scroll_speed
+        self._scroll_listeners = []
         
         # Initialize parent
         super().__init__(
@@ -75,6 +76,8 @@ class AutoHideScrollableFrame(CTkScrollableFrame):
     def _on_canvas_scroll_autohide(self, *args):
         """Handle scrollbar visibility based on scroll position."""
         self._scrollbar.set(*args)
+        for callback in self._scroll_listeners:
+            callback()
         
         # Auto-hide scrollbar when all content is visible
         top, bottom = args
@@ -87,6 +90,16 @@ class AutoHideScrollableFrame(CTkScrollableFrame):
             )
             self._scrollbar.grid(row=1, column=1, sticky="ns", pady=border_spacing)
     
+    def add_scroll_listener(self, callback):
+        """Call `callback` (no arguments) whenever the visible region changes."""
+        self._scroll_listeners.append(callback)
+
+    def visible_region(self):
+        """Return the (top, bottom) y range of the frame currently visible in the canvas."""
+        top = self._parent_canvas.canvasy(0)
+        height = max(self._parent_canvas.winfo_height(), self._parent_canvas.winfo_reqheight())
+        return top, top + height
+
     def _on_frame_configure_debounced(self, event):
         """Debounced frame configure to prevent flickering."""
         # Update scroll region immediately
@@ -54,17 +54,57 @@ class BaseChart:
 
         parent.bind("<Destroy>", cleanup, add="+")
 
+    @staticmethod
+    def enable_canvas_reuse(parent):
+        """Make later charts in parent redraw its one figure and canvas instead of adding new ones."""
+        parent._reused_chart = {"canvas": None, "toolbar": None}
+
+    @staticmethod
+    def new_figure(parent, figsize):
+        """Return (fig, ax) to draw on: parent's reused figure, cleared, or a new figure."""
+        reused = getattr(parent, "_reused_chart", None)
+        if reused is not None and reused["canvas"] is not None:
+            fig = reused["canvas"].figure
+            fig.clear()
+            return fig, fig.add_subplot()
+        return plt.subplots(figsize=figsize)
+
     @staticmethod
     def render_canvas(parent, fig, *, pack_kwargs=None, show_toolbar=False):
         """Render and pack a figure into a tkinter parent."""
+        pack_kwargs = pack_kwargs or {"fill": "both", "expand": True}
+        reused = getattr(parent, "_reused_chart", None)
+        if reused is not None and reused["canvas"] is not None and reused["canvas"].figure is fig:
+            return BaseChart._redraw_canvas(parent, reused, pack_kwargs, show_toolbar)
+
         canvas = FigureCanvasTkAgg(fig, master=parent)
         canvas.draw()
-        canvas.get_tk_widget().pack(**(pack_kwargs or {"fill": "both", "expand": True}))
+        canvas.get_tk_widget().pack(**pack_kwargs)
+        toolbar = None
         if show_toolbar:
             toolbar = NavigationToolbar2Tk(canvas, parent, pack_toolbar=False)
             toolbar.update()
             toolbar.pack(fill="x")
         BaseChart.setup_graph_cleanup(parent, canvas, fig)
+        if reused is not None:
+            reused.update(canvas=canvas, toolbar=toolbar)
+        return canvas
+
+    @staticmethod
+    def _redraw_canvas(parent, reused, pack_kwargs, show_toolbar):
+        """Redraw the reused canvas after its figure was cleared and drawn again."""
+        canvas = reused["canvas"]
+        canvas.get_tk_widget().pack(**pack_kwargs)
+        toolbar = reused["toolbar"]
+        if show_toolbar:
+            if toolbar is None:
+                toolbar = reused["toolbar"] = NavigationToolbar2Tk(canvas, parent, pack_toolbar=False)
+            # Resets the pan/zoom history, which pointed at the cleared axes.
+            toolbar.update()
+            toolbar.pack(fill="x")
+        elif toolbar is not None:
+            toolbar.pack_forget()
+        canvas.draw_idle()
         return canvas
 
 
@@ -93,7 +133,7 @@ class BarChart(BaseChart):
         width = 0.25 if n <= 2 else 0.6
         x_lim = (-0.1, 1.1) if n <= 2 else (-0.5, n - 0.5)
 
-        fig, ax = plt.subplots(figsize=(11, 6.5))
+        fig, ax = BaseChart.new_figure(parent, (11, 6.5))
         fig.patch.set_facecolor(GRAPH_BG)
         ax.set_facecolor(GRAPH_BG)
 
@@ -268,7 +308,7 @@ class TrendChart(BaseChart):
     ) -> FigureCanvasTkAgg:
         """Create and embed a multi-series trend line chart with grid, legend, and optional KPIs."""
         if not series:
-            fig, ax = plt.subplots(figsize=(11, 6.5))
+            fig, ax = BaseChart.new_figure(parent, (11, 6.5))
             fig.patch.set_facecolor(GRAPH_BG)
             ax.set_facecolor(GRAPH_BG)
             ax.set_title(title or "No data for the selected period", fontsize=16, color=GRAPH_TITLE_COLOR)
@@ -279,7 +319,7 @@ class TrendChart(BaseChart):
             )
 
         use_twin = secondary_axis is not None
-        fig, ax = plt.subplots(figsize=(11, 6.5))
+        fig, ax = BaseChart.new_figure(parent, (11, 6.5))
         ax2 = ax.twinx() if use_twin else None
 
         fig.patch.set_facecolor(GRAPH_BG)
@@ -495,7 +535,7 @@ class PieChart(BaseChart):
         return_figure: bool = False,
     ) -> FigureCanvasTkAgg | plt.Figure:
         """Create and embed a pie chart showing distribution."""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = BaseChart.new_figure(None if return_figure else parent, (8, 6))
         fig.patch.set_facecolor(GRAPH_BG)
         ax.set_facecolor(GRAPH_BG)
 
@@ -560,7 +600,7 @@ class ComparisonBarChart(BaseChart):
         return_figure: bool = False,
     ) -> FigureCanvasTkAgg | plt.Figure:
         """Create a comparison bar chart."""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = BaseChart.new_figure(None if return_figure else parent, (8, 6))
         fig.patch.set_facecolor("white")
         ax.set_facecolor("white")
 
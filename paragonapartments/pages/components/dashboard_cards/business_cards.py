@@ -8,6 +8,18 @@ import customtkinter as ctk
 import pages.components.page_elements as pe
 
 
+def _refreshing_cities(action):
+    """Wrap a location change so the cached city list is dropped once it succeeds."""
+
+    def run(*args):
+        result = action(*args)
+        if result is True:
+            pe.invalidate_city_cache()
+        return result
+
+    return run
+
+
 def load_manager_business_expansion_card(self, row):
     expand_card = pe.FunctionCard(row, "Expand Business", side="top", pady=6, padx=8)
 
@@ -29,7 +41,7 @@ def load_manager_business_expansion_card(self, row):
         location_fields,
         name="Add Location",
         submit_text="Add Location",
-        on_submit=self.expand_business,
+        on_submit=_refreshing_cities(self.expand_business),
     )
 
     loc_btn, open_loc_popup = pe.PopupCard(
@@ -61,8 +73,8 @@ def load_manager_business_expansion_card(self, row):
             content,
             columns,
             get_data_func=get_data,
-            on_delete_func=self.delete_location,
-            on_update_func=self.edit_location,
+            on_delete_func=_refreshing_cities(self.delete_location),
+            on_update_func=_refreshing_cities(self.edit_location),
         )
 
     loc_btn.configure(command=setup_loc_popup)
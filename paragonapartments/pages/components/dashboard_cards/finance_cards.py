@@ -91,7 +91,7 @@ def load_finance_summary_card(self, row, side="left"):
         bar_text_generator=generate_financial_analysis,
     )
 
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(summary_card, update_summary)
+    schedule_refresh = pe.create_debounced_refresh(summary_card, update_summary)
     location_dropdown.configure(command=schedule_refresh)
     update_summary()
 
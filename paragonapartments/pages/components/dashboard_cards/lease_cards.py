@@ -43,7 +43,7 @@ def load_admin_lease_card(self, row):
             print(f"Error loading lease data: {e}")
 
     update_lease_display()
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(lease_card, update_lease_display)
+    schedule_refresh = pe.create_debounced_refresh(lease_card, update_lease_display)
 
     def generate_lease_stats():
         stats_data = self.get_lease_statistics(self.location)
@@ -481,7 +481,7 @@ def load_maintenance_summary_card(self, row):
             print(f"Error loading maintenance stats: {e}")
 
     update_summary()
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(summary_card, update_summary)
+    schedule_refresh = pe.create_debounced_refresh(summary_card, update_summary)
     location_dropdown.configure(command=schedule_refresh)
 
 
@@ -568,27 +568,20 @@ def load_maintenance_pending_requests_card(self, row):
         )
         _, refresh_table = table.table_container, table.refresh_table
 
-        ctk.CTkButton(
-            header,
-            text="⟳ Refresh",
-            command=refresh_table,
-            height=32,
-            width=120,
-            fg_color=("gray70", "gray30"),
-            hover_color=("gray60", "gray25"),
-        ).pack(side="left", padx=(12, 0))
+        pe.create_refresh_button(header, refresh_table, side="left", padx=(12, 0))
 
-        refresh_timer = {"id": None}
+        timer_id = None
 
         def schedule_refresh(_choice=None):
-            if refresh_timer["id"] is not None:
+            nonlocal timer_id
+            if timer_id is not None:
                 try:
-                    content.after_cancel(refresh_timer["id"])
+                    content.after_cancel(timer_id)
                 except Exception:
                     pass
             if hasattr(refresh_table, "reset_page"):
                 refresh_table.reset_page()
-            refresh_timer["id"] = content.after(150, refresh_table)
+            timer_id = content.after(150, refresh_table)
 
         location_dropdown.configure(command=schedule_refresh)
         priority_dropdown.configure(command=schedule_refresh)
@@ -929,17 +922,18 @@ def _load_all_requests_button(self, parent):
 
         pe.create_refresh_button(header, refresh_table, side="left", padx=(12, 0))
 
-        refresh_timer = {"id": None}
+        timer_id = None
 
         def schedule_refresh(_choice=None):
-            if refresh_timer["id"] is not None:
+            nonlocal timer_id
+            if timer_id is not None:
                 try:
-                    content.after_cancel(refresh_timer["id"])
+                    content.after_cancel(timer_id)
                 except Exception:
                     pass
             if hasattr(refresh_table, "reset_page"):
                 refresh_table.reset_page()
-            refresh_timer["id"] = content.after(150, refresh_table)
+            timer_id = content.after(150, refresh_table)
 
         location_dropdown.configure(command=schedule_refresh)
         status_dropdown.configure(command=schedule_refresh)
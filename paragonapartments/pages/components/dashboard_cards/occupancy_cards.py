@@ -41,7 +41,7 @@ def load_admin_occupancy_card(self, row):
             print(f"Error loading occupancy data: {e}")
 
     update_occupancy_display()
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(occupancy_card, update_occupancy_display)
+    schedule_refresh = pe.create_debounced_refresh(occupancy_card, update_occupancy_display)
 
     button_container = ctk.CTkFrame(occupancy_card, fg_color="transparent")
     button_container.pack(fill="x", pady=(5, 0))
@@ -118,7 +118,7 @@ def load_manager_occupancy_card(self, row):
         occupancy_badge.configure(text=f"Total units: {total_count}")
 
     update_occupancy_display()
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(occupancy_card, update_occupancy_display)
+    schedule_refresh = pe.create_debounced_refresh(occupancy_card, update_occupancy_display)
     location_dropdown.configure(command=schedule_refresh)
 
     def generate_occupancy_stats(location=None):
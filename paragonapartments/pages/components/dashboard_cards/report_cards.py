@@ -40,7 +40,7 @@ def load_admin_report_card(self, row):
             print(f"Error loading revenue data: {e}")
 
     update_performance_display()
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(reports_card, update_performance_display)
+    schedule_refresh = pe.create_debounced_refresh(reports_card, update_performance_display)
 
     def generate_performance_stats():
         actual = self.get_monthly_revenue(self.location)
@@ -115,7 +115,7 @@ def load_manager_report_card(self, row):
         vacant_badge.configure(text=f"Vacant units: {vacant}")
 
     update_performance_display()
-    refresh_timer, schedule_refresh = pe.create_debounced_refresh(reports_card, update_performance_display)
+    schedule_refresh = pe.create_debounced_refresh(reports_card, update_performance_display)
     location_dropdown.configure(command=schedule_refresh)
 
     def generate_performance_stats(location=None):
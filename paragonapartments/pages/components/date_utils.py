@@ -2,42 +2,135 @@
 
 Date helper functions, including calendar popup integration."""
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
 import customtkinter as ctk
 
 from pages.components.config.theme import THEME
 from pages.components.popup_utils import enable_click_outside_to_close
+from pages.components.style_utils import shared_font
 
-try:
-    from tkcalendar import Calendar
-except Exception:
-    Calendar = None
+
+@lru_cache(maxsize=1)
+def _get_calendar_class():
+    """Import tkcalendar on first use; returns None when it is not installed."""
+    try:
+        from tkcalendar import Calendar
+    except Exception:
+        return None
+    return Calendar
+
+
+# Calendar styling per appearance mode; only the selected date is added per popup.
+# Both modes set the same keys so the shared picker can be restyled either way.
+_CALENDAR_BASE_KWARGS = {
+    "selectmode": "day",
+    "date_pattern": "yyyy-mm-dd",
+    "font": ("Arial", 17),
+    "headersfont": ("Arial", 15, "bold"),
+    "selectbackground": THEME.colors.primary_blue,
+    "selectforeground": "#FFFFFF",
+}
+_CALENDAR_DARK_KWARGS = {
+    **_CALENDAR_BASE_KWARGS,
+    "background": "#2A2F36",
+    "foreground": "#E9ECF2",
+    "bordercolor": "#2A2F36",
+    "headersbackground": "#222831",
+    "headersforeground": "#E9ECF2",
+    "normalbackground": "#2A2F36",
+    "normalforeground": "#E9ECF2",
+    "weekendbackground": "#2A2F36",
+    "weekendforeground": "#E9ECF2",
+    "othermonthbackground": "#2A2F36",
+    "othermonthforeground": "#7F8A98",
+}
+_CALENDAR_LIGHT_KWARGS = {
+    **_CALENDAR_BASE_KWARGS,
+    "background": "#FFFFFF",
+    "foreground": "#1B2430",
+    "bordercolor": "#D7DBE2",
+    "headersbackground": "#EEF2F7",
+    "headersforeground": "#1B2430",
+    "normalbackground": "#FFFFFF",
+    "normalforeground": "#1B2430",
+    # tkcalendar's own defaults, so light mode looks as it did before restyling existed.
+    "weekendbackground": "gray80",
+    "weekendforeground": "gray30",
+    "othermonthbackground": "gray93",
+    "othermonthforeground": "gray45",
+}
+
+_IS_DARK = ctk.get_appearance_mode() == "Dark"
+
+
+def _track_appearance_mode(mode):
+    """Appearance-mode listener so pickers don't query the mode on every open."""
+    global _IS_DARK
+    _IS_DARK = mode == "Dark"
+
+
+ctk.AppearanceModeTracker.add(_track_appearance_mode)
+
+# The shared date picker popup, its calendar, and the entry it is filling in.
+_PICKER = {"popup": None, "cal": None, "entry": None, "selected": None, "style": None, "release": None}
 
 
 def parse_date_string(date_str):
     """Parse YYYY-MM-DD date string to a date object."""
-    s = (date_str or "").strip()
-    if not s:
+    if not date_str:
+        return None
+    s = date_str.strip()
+    # Fixed format, so split and convert directly instead of going through strptime.
+    # Like %m/%d, month and day may be one or two digits.
+    parts = s.split("-")
+    if len(parts) != 3:
+        return None
+    year, month, day = parts
+    if len(year) != 4 or not 1 <= len(month) <= 2 or not 1 <= len(day) <= 2:
+        return None
+    if not (year + month + day).isdigit():
         return None
     try:
-        return datetime.strptime(s, "%Y-%m-%d").date()
-    except Exception:
+        return date(int(year), int(month), int(day))
+    except ValueError:
         return None
 
 
-def open_date_picker(entry_widget, parent_window):
-    """Open a calendar date picker popup for an entry widget."""
-    popup = ctk.CTkToplevel(parent_window)
+def _current_calendar_style():
+    return _CALENDAR_DARK_KWARGS if _IS_DARK else _CALENDAR_LIGHT_KWARGS
+
+
+def _hide_date_picker():
+    """Hide the shared date picker and drop its click-outside binding."""
+    release = _PICKER["release"]
+    _PICKER["release"] = None
+    if release is not None:
+        release()
+    popup = _PICKER["popup"]
+    if popup is not None and popup.winfo_exists():
+        popup.withdraw()
+
+
+def _apply_date():
+    cal, entry = _PICKER["cal"], _PICKER["entry"]
+    if cal is None or entry is None:
+        return
+    if entry.winfo_exists():
+        entry.delete(0, "end")
+        entry.insert(0, cal.get_date())
+    _hide_date_picker()
+
+
+def _build_date_picker(master):
+    """Create the shared popup; the calendar itself is added once it is on screen."""
+    popup = ctk.CTkToplevel(master)
     popup.title("Select Date")
     popup.geometry("360x430")
     popup.resizable(False, False)
-    popup.transient(parent_window)
-    enable_click_outside_to_close(popup, parent_window)
-
-    selected = parse_date_string(entry_widget.get()) or datetime.now().date()
-    mode = str(ctk.get_appearance_mode()).lower()
-    is_dark = mode == "dark"
+    popup.protocol("WM_DELETE_WINDOW", _hide_date_picker)
+    _PICKER.update(popup=popup, cal=None)
 
     shell = ctk.CTkFrame(
         popup,
@@ -51,100 +144,108 @@ def open_date_picker(entry_widget, parent_window):
     ctk.CTkLabel(
         shell,
         text="Pick a Date",
-        font=("Arial", 24, "bold"),
+        font=shared_font(24, "bold"),
         text_color=("#22252B", "#E9ECF2"),
     ).pack(anchor="w", padx=12, pady=(12, 4))
     ctk.CTkLabel(
         shell,
         text="Format: YYYY-MM-DD",
-        font=("Arial", 12),
+        font=shared_font(12),
         text_color=("#5E6672", "#AAB2BE"),
     ).pack(anchor="w", padx=12, pady=(0, 8))
 
-    if Calendar is None:
-        ctk.CTkLabel(
-            shell,
-            text="Calendar unavailable.\nInstall tkcalendar package.",
-            justify="center",
-            font=("Arial", 12),
-        ).pack(pady=18)
-        ctk.CTkButton(shell, text="Close", command=popup.destroy, width=120).pack(pady=(10, 0))
-        return
-
-    cal_kwargs = {
-        "selectmode": "day",
-        "date_pattern": "yyyy-mm-dd",
-        "year": selected.year,
-        "month": selected.month,
-        "day": selected.day,
-    }
-
-    if is_dark:
-        cal_kwargs.update(
-            {
-                "font": ("Arial", 17),
-                "headersfont": ("Arial", 15, "bold"),
-                "background": "#2A2F36",
-                "foreground": "#E9ECF2",
-                "bordercolor": "#2A2F36",
-                "headersbackground": "#222831",
-                "headersforeground": "#E9ECF2",
-                "normalbackground": "#2A2F36",
-                "normalforeground": "#E9ECF2",
-                "weekendbackground": "#2A2F36",
-                "weekendforeground": "#E9ECF2",
-                "othermonthbackground": "#2A2F36",
-                "othermonthforeground": "#7F8A98",
-                "selectbackground": THEME.colors.primary_blue,
-                "selectforeground": "#FFFFFF",
-            }
-        )
-    else:
-        cal_kwargs.update(
-            {
-                "font": ("Arial", 17),
-                "headersfont": ("Arial", 15, "bold"),
-                "background": "#FFFFFF",
-                "foreground": "#1B2430",
-                "bordercolor": "#D7DBE2",
-                "headersbackground": "#EEF2F7",
-                "headersforeground": "#1B2430",
-                "normalbackground": "#FFFFFF",
-                "normalforeground": "#1B2430",
-                "selectbackground": THEME.colors.primary_blue,
-                "selectforeground": "#FFFFFF",
-            }
-        )
-
-    cal = Calendar(shell, **cal_kwargs, showweeknumbers=False)
-    cal.pack(fill="both", expand=True, padx=12, pady=(4, 10))
-
-    def apply_date():
-        entry_widget.delete(0, "end")
-        entry_widget.insert(0, cal.get_date())
-        popup.destroy()
-
     btn_row = ctk.CTkFrame(shell, fg_color="transparent")
-    btn_row.pack(fill="x", padx=10, pady=(0, 10))
+    btn_row.pack(side="bottom", fill="x", padx=10, pady=(0, 10))
+
+    loading = ctk.CTkLabel(
+        shell,
+        text="Loading…",
+        font=shared_font(12),
+        text_color=("#5E6672", "#AAB2BE"),
+    )
+    loading.pack(expand=True)
 
     ctk.CTkButton(
         btn_row,
         text="Cancel",
-        command=popup.destroy,
+        command=_hide_date_picker,
         width=104,
         height=34,
-        font=("Arial", 14),
+        font=shared_font(14),
         fg_color=THEME.colors.secondary_gray,
         hover_color=THEME.colors.secondary_gray_hover,
         text_color=THEME.colors.text,
     ).pack(side="left")
-    ctk.CTkButton(
+    use_button = ctk.CTkButton(
         btn_row,
         text="Use Date",
-        command=apply_date,
+        command=_apply_date,
+        state="disabled",
         width=104,
         height=34,
-        font=("Arial", 14),
+        font=shared_font(14),
         fg_color=THEME.colors.primary_blue,
         hover_color=THEME.colors.primary_blue_hover,
-    ).pack(side="right")
+    )
+    use_button.pack(side="right")
+
+    def build_calendar():
+        # The calendar is the slow part, so it is built once the shell is on screen.
+        if not popup.winfo_exists():
+            return
+        loading.destroy()
+        Calendar = _get_calendar_class()
+        if Calendar is None:
+            ctk.CTkLabel(
+                shell,
+                text="Calendar unavailable.\nInstall tkcalendar package.",
+                justify="center",
+                font=shared_font(12),
+            ).pack(pady=18)
+            return
+
+        # Read at build time, in case the picker was reopened before this ran.
+        selected, style = _PICKER["selected"], _current_calendar_style()
+        cal_kwargs = {
+            **style,
+            "year": selected.year,
+            "month": selected.month,
+            "day": selected.day,
+        }
+        cal = Calendar(shell, **cal_kwargs, showweeknumbers=False)
+        cal.pack(fill="both", expand=True, padx=12, pady=(4, 10))
+        _PICKER.update(cal=cal, style=style)
+        use_button.configure(state="normal")
+
+    popup.update_idletasks()
+    popup.after(1, build_calendar)
+    return popup
+
+
+def open_date_picker(entry_widget, parent_window):
+    """Open a calendar date picker popup for an entry widget."""
+    selected = parse_date_string(entry_widget.get()) or datetime.now().date()
+
+    # One popup is shared by every date field and hidden between uses, so the
+    # calendar is only built once. It belongs to the root window so closing the
+    # form that opened it does not take it down.
+    _hide_date_picker()
+    _PICKER.update(entry=entry_widget, selected=selected)
+    popup = _PICKER["popup"]
+    if popup is None or not popup.winfo_exists():
+        popup = _build_date_picker(parent_window._root())
+    else:
+        cal = _PICKER["cal"]
+        if cal is not None:
+            style = _current_calendar_style()
+            if _PICKER["style"] is not style:
+                cal.configure(**style)
+                _PICKER["style"] = style
+            cal.selection_set(selected)
+            cal.see(selected)
+        popup.deiconify()
+
+    popup.transient(parent_window)
+    popup.lift()
+    popup.focus_set()
+    _PICKER["release"] = enable_click_outside_to_close(popup, parent_window, on_close=_hide_date_picker)
@@ -3,19 +3,25 @@
 Graph popup utilities using a class-based API."""
 
 import customtkinter as ctk
-from database_operations.database_repositories import get_all_cities
 
+from .chart_utils import BaseChart
 from .config.theme import THEME
 from .date_utils import open_date_picker
 from .pdf_export_utils import PDFExportUI
-from .style_utils import style_primary_button
+from .style_utils import shared_font, style_primary_button
 from .ui_controls_utils import (
     create_debounced_refresh,
     create_refresh_button,
+    load_location_options_when_idle,
     normalize_location_value,
 )
 
 
+def _grouping_for(choice):
+    """Map grouping dropdown text to "year" or "month"; only "Yearly" starts with a Y."""
+    return "year" if (choice or "").lstrip()[:1] in ("Y", "y") else "month"
+
+
 class GraphPopup:
     """Builds graph popups with date/location controls and export integration."""
 
@@ -88,15 +94,17 @@ class GraphPopup:
 
         popup_location_dropdown = None
         if include_location:
-            ctk.CTkLabel(row_top, text="Location:", font=("Arial", 14, "bold")).pack(side="left", padx=(0, 8))
-            popup_cities = ["All Locations"] + get_all_cities()
-            popup_location_dropdown = ctk.CTkComboBox(row_top, values=popup_cities, width=220, font=("Arial", 13))
+            ctk.CTkLabel(row_top, text="Location:", font=shared_font(14, "bold")).pack(side="left", padx=(0, 8))
+            popup_location_dropdown = ctk.CTkComboBox(
+                row_top, values=("All Locations",), width=220, font=shared_font(13)
+            )
             popup_location_dropdown.set(default_location or "All Locations")
             popup_location_dropdown.pack(side="left")
+            load_location_options_when_idle(popup_location_dropdown)
 
         label_padx = (18, 8) if include_location else (0, 8)
-        ctk.CTkLabel(row_top, text="Grouping:", font=("Arial", 14, "bold")).pack(side="left", padx=label_padx)
-        grouping_dropdown = ctk.CTkComboBox(row_top, values=["Monthly", "Yearly"], width=140, font=("Arial", 13))
+        ctk.CTkLabel(row_top, text="Grouping:", font=shared_font(14, "bold")).pack(side="left", padx=label_padx)
+        grouping_dropdown = ctk.CTkComboBox(row_top, values=["Monthly", "Yearly"], width=140, font=shared_font(13))
         grouping_dropdown.set("Monthly")
         grouping_dropdown.pack(side="left")
 
@@ -113,18 +121,18 @@ class GraphPopup:
             except Exception as exc:
                 print(f"Error getting default date range: {exc}")
 
-        ctk.CTkLabel(row_dates, text="Start (YYYY-MM-DD):", font=("Arial", 13, "bold")).pack(side="left", padx=(0, 8))
+        ctk.CTkLabel(row_dates, text="Start (YYYY-MM-DD):", font=shared_font(13, "bold")).pack(side="left", padx=(0, 8))
         start_wrap = ctk.CTkFrame(row_dates, fg_color="transparent")
         start_wrap.pack(side="left")
-        start_entry = ctk.CTkEntry(start_wrap, width=140, font=("Arial", 13))
+        start_entry = ctk.CTkEntry(start_wrap, width=140, font=shared_font(13))
         if default_start:
             start_entry.insert(0, default_start)
         start_entry.pack(side="left")
 
-        ctk.CTkLabel(row_dates, text="End (YYYY-MM-DD):", font=("Arial", 13, "bold")).pack(side="left", padx=(18, 8))
+        ctk.CTkLabel(row_dates, text="End (YYYY-MM-DD):", font=shared_font(13, "bold")).pack(side="left", padx=(18, 8))
         end_wrap = ctk.CTkFrame(row_dates, fg_color="transparent")
         end_wrap.pack(side="left")
-        end_entry = ctk.CTkEntry(end_wrap, width=140, font=("Arial", 13))
+        end_entry = ctk.CTkEntry(end_wrap, width=140, font=shared_font(13))
         if default_end:
             end_entry.insert(0, default_end)
         end_entry.pack(side="left")
@@ -134,7 +142,7 @@ class GraphPopup:
             text="📅",
             width=34,
             height=28,
-            font=("Arial", 13),
+            font=shared_font(13),
             command=lambda: open_date_picker(start_entry, content.winfo_toplevel()),
             fg_color=THEME.colors.secondary_gray,
             hover_color=THEME.colors.secondary_gray_hover,
@@ -145,7 +153,7 @@ class GraphPopup:
             text="📅",
             width=34,
             height=28,
-            font=("Arial", 13),
+            font=shared_font(13),
             command=lambda: open_date_picker(end_entry, content.winfo_toplevel()),
             fg_color=THEME.colors.secondary_gray,
             hover_color=THEME.colors.secondary_gray_hover,
@@ -155,8 +163,7 @@ class GraphPopup:
         def apply_grouping_defaults(grouping_value):
             if not get_date_range_func or date_range_params is None:
                 return
-            gv = (grouping_value or "").strip().lower()
-            grouping = "year" if gv.startswith("year") else "month"
+            grouping = _grouping_for(grouping_value)
             try:
                 rng = get_date_range_func(date_range_params, grouping=grouping)
                 start_entry.delete(0, "end")
@@ -168,7 +175,7 @@ class GraphPopup:
             except Exception as exc:
                 print(f"Error applying grouping defaults: {exc}")
 
-        error_label = ctk.CTkLabel(content, text="", font=("Arial", 12), text_color="red", wraplength=900)
+        error_label = ctk.CTkLabel(content, text="", font=shared_font(12), text_color="red", wraplength=900)
         graph_container = ctk.CTkFrame(content, fg_color="transparent")
         graph_container.pack(fill="both", expand=True)
 
@@ -221,14 +228,13 @@ class GraphPopup:
         export_btn = controls["export_btn"]
         current_canvas = controls["current_canvas"]
         apply_grouping_defaults = controls["apply_grouping_defaults"]
+        rendered_dates = None
 
-        def render_graph():
-            for widget in graph_container.winfo_children():
-                try:
-                    widget.destroy()
-                except Exception:
-                    pass
+        # The graph is redrawn on one canvas rather than rebuilt on every refresh.
+        BaseChart.enable_canvas_reuse(graph_container)
 
+        def render_graph():
+            nonlocal rendered_dates
             try:
                 if fixed_location:
                     location = fixed_location
@@ -241,10 +247,10 @@ class GraphPopup:
                 else:
                     location = None
 
-                start_date = start_entry.get().strip() or None
-                end_date = end_entry.get().strip() or None
-                grouping_value = (grouping_dropdown.get() or "Monthly").strip().lower()
-                grouping = "year" if grouping_value.startswith("year") else "month"
+                rendered_dates = (start_entry.get(), end_entry.get())
+                start_date = rendered_dates[0].strip() or None
+                end_date = rendered_dates[1].strip() or None
+                grouping = _grouping_for(grouping_dropdown.get())
 
                 if location is not None:
                     canvas = graph_function(
@@ -268,9 +274,12 @@ class GraphPopup:
                 error_label.configure(text=str(exc))
                 error_label.pack(fill="x", padx=10, pady=(0, 5), before=graph_container)
                 current_canvas["canvas"] = None
+                for widget in graph_container.winfo_children():
+                    widget.pack_forget()
+                rendered_dates = None
 
         refresh_btn.configure(command=render_graph)
-        _, schedule_refresh = create_debounced_refresh(content, render_graph)
+        schedule_refresh = create_debounced_refresh(content, render_graph)
 
         if location_dropdown is not None:
             location_dropdown.configure(command=schedule_refresh)
@@ -280,10 +289,17 @@ class GraphPopup:
             schedule_refresh(choice)
 
         grouping_dropdown.configure(command=on_grouping_change)
-        start_entry.bind("<Return>", lambda _: schedule_refresh())
-        start_entry.bind("<FocusOut>", lambda _: schedule_refresh())
-        end_entry.bind("<Return>", lambda _: schedule_refresh())
-        end_entry.bind("<FocusOut>", lambda _: schedule_refresh())
+
+        def on_dates_committed(_event=None):
+            # Leaving or confirming an entry whose text is already on screen
+            # would only redraw the same graph.
+            if (start_entry.get(), end_entry.get()) != rendered_dates:
+                schedule_refresh()
+
+        start_entry.bind("<Return>", on_dates_committed)
+        start_entry.bind("<FocusOut>", on_dates_committed)
+        end_entry.bind("<Return>", on_dates_committed)
+        end_entry.bind("<FocusOut>", on_dates_committed)
 
         render_graph()
 
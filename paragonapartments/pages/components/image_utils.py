@@ -2,16 +2,23 @@
 
 Image helper functions."""
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
 
-def round_image_corners(image, radius):
-    """Add rounded corners to an image."""
-    mask = Image.new("L", image.size, 0)
+@lru_cache(maxsize=64)
+def _corner_mask(width, height, radius):
+    """Alpha mask for a rounded rectangle; shared, so never modify it."""
+    mask = Image.new("L", (width, height), 0)
     draw = ImageDraw.Draw(mask)
-    draw.rounded_rectangle([(0, 0), image.size], radius=radius, fill=255)
+    draw.rounded_rectangle([(0, 0), (width, height)], radius=radius, fill=255)
+    return mask
 
-    output = Image.new("RGBA", image.size)
-    output.paste(image, (0, 0))
+
+def round_image_corners(image, radius):
+    """Add rounded corners to an image."""
+    mask = _corner_mask(image.size[0], image.size[1], radius)
+    output = image.convert("RGBA") if image.mode != "RGBA" else image.copy()
     output.putalpha(mask)
     return output
@@ -3,6 +3,10 @@
 from datetime import datetime, timedelta, date
 import re
 
+# Compiled once for the per-keystroke validators below.
+_CURRENCY_INPUT_RE = re.compile(r'\d*\.?\d{0,2}')
+_DATE_INPUT_RE = re.compile(r'(\d{0,4}(-\d{0,2}(-\d{0,2})?)?)?')
+
 def is_email_valid(email: str) -> bool:
     """Validate email format."""
     if not email:
@@ -169,7 +173,7 @@ def validate_currency_input(value: str) -> bool:
         "123." -> True
         "" -> True
     """
-    return re.match(r'^\d*\.?\d{0,2}$', value) is not None
+    return _CURRENCY_INPUT_RE.fullmatch(value) is not None
 
 
 def validate_date_input(value: str) -> bool:
@@ -192,7 +196,42 @@ def validate_date_input(value: str) -> bool:
         "2026-2-26" -> True (will be accepted for progressive typing)
         "abcd" -> False
     """
-    return re.match(r'^(\d{0,4}(-\d{0,2}(-\d{0,2})?)?)?$', value) is not None
+    return _DATE_INPUT_RE.fullmatch(value) is not None
+
+
+
+def validator_command(widget, validator, placeholder=None) -> tuple[str, str]:
+    """
+    Return a (tcl_name, "%P") validatecommand for a validator, registering it once per Tk root.
+
+    Registering on the root instead of on each entry avoids a new Tcl command per widget;
+    the cache lives on the root, so it goes away with it.
+
+    Args:
+        widget: Any widget belonging to the target Tk root
+        validator: Callable taking the proposed value and returning True if valid
+        placeholder: CTkEntry placeholder text to accept as-is, since CTk inserts it
+            into the entry and it would otherwise be rejected
+
+    Usage:
+        entry = ctk.CTkEntry(
+            parent,
+            placeholder_text="0",
+            validate="key",
+            validatecommand=validator_command(parent, validate_number_input, "0"),
+        )
+    """
+    root = widget._root()
+    commands = root.__dict__.setdefault("_validator_commands", {})
+    key = (validator, placeholder)
+    if key not in commands:
+        if placeholder:
+            def check(value, validator=validator, placeholder=placeholder):
+                return value == placeholder or validator(value)
+        else:
+            check = validator
+        commands[key] = root.register(check)
+    return commands[key], "%P"
 
 
 # ============================= Formatting Helpers =============================
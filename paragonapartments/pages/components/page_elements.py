@@ -47,6 +47,9 @@ from .ui_controls_utils import (
     content_separator,
     vertical_divider,
     create_dynamic_dropdown_with_refresh,
+    get_location_options,
+    load_location_options_when_idle,
+    invalidate_city_cache,
 )
 from .image_utils import (
     round_image_corners,
@@ -109,6 +112,9 @@ __all__ = [
     'content_separator',
     'vertical_divider',
     'create_dynamic_dropdown_with_refresh',
+    'get_location_options',
+    'load_location_options_when_idle',
+    'invalidate_city_cache',
     'round_image_corners',
     'PDFReportExporter',
     'PDFExportUI',
@@ -2,8 +2,26 @@
 Popup helper functions."""
 
 
-def enable_click_outside_to_close(popup, parent_window):
-    """Enable closing a popup by clicking outside of it."""
+def _remove_binding(widget, sequence, funcid):
+    """Remove one callback bound to sequence, keeping the widget's other handlers.
+
+    Misc.unbind(sequence, funcid) clears every handler for the sequence on
+    Python < 3.13, so the callback's line is cut out of the bind script instead.
+    """
+    script = widget.bind(sequence) or ""
+    kept = [line for line in script.split("\n") if funcid not in line]
+    widget.bind(sequence, "\n".join(kept))
+    widget.deletecommand(funcid)
+
+
+def enable_click_outside_to_close(popup, parent_window, on_close=None):
+    """Enable closing a popup by clicking outside of it.
+
+    on_close replaces the default destroy. Returns a function that removes the
+    click-outside binding; it is also removed when the popup is destroyed.
+    """
+    close = on_close or popup.destroy
+    binding_id = None
 
     def check_click_outside(event):
         if popup.winfo_exists():
@@ -18,18 +36,27 @@ def enable_click_outside_to_close(popup, parent_window):
             outside_y = click_y < popup_y or click_y > popup_y + popup_height
 
             if outside_x or outside_y:
-                popup.destroy()
-                parent_window.unbind("<Button-1>", binding_id)
+                release()
+                close()
 
-    binding_id = parent_window.bind("<Button-1>", check_click_outside, add="+")
-
-    def on_popup_destroy(_event=None):
+    def release():
+        nonlocal binding_id
+        if binding_id is None:
+            return
         try:
-            parent_window.unbind("<Button-1>", binding_id)
+            _remove_binding(parent_window, "<Button-1>", binding_id)
         except Exception:
             pass
+        binding_id = None
 
+    def on_popup_destroy(event):
+        # <Destroy> on a toplevel also arrives for each of its children.
+        if event.widget is popup:
+            release()
+
+    binding_id = parent_window.bind("<Button-1>", check_click_outside, add="+")
     popup.bind("<Destroy>", on_popup_destroy)
+    return release
 
 
 def center_popup(popup, width, height):
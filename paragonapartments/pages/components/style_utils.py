@@ -1,21 +1,39 @@
 """Contributors: Aaron Antal-Bento (23013693), Ahmed AlShamy (24045361)
 Styling helper functions for CTk widgets."""
 
+from functools import lru_cache
+
+import customtkinter as ctk
 from customtkinter import ThemeManager
 
 from pages.components.config.theme import THEME
 
+# Fixed button options, resolved once; only the font varies per call.
+_PRIMARY_BUTTON_STYLE = {
+    "height": 40,
+    "corner_radius": THEME.radii.button,
+    "fg_color": (THEME.colors.primary_blue, THEME.colors.primary_blue),
+    "hover_color": (THEME.colors.primary_blue_hover, THEME.colors.primary_blue_hover),
+}
+_SECONDARY_BUTTON_STYLE = {
+    "height": 40,
+    "corner_radius": THEME.radii.button,
+    "fg_color": THEME.colors.secondary_gray,
+    "hover_color": THEME.colors.secondary_gray_hover,
+    "text_color": THEME.colors.text,
+}
+
+
+@lru_cache(maxsize=None)
+def shared_font(size, weight="normal"):
+    """Return one app-wide CTkFont per (size, weight); call only once a Tk root exists."""
+    return ctk.CTkFont(family=THEME.typography.family, size=size, weight=weight)
+
 
 def style_primary_button(button, font_size=14):
     """Apply primary button styling."""
     try:
-        button.configure(
-            height=40,
-            font=("Arial", font_size, "bold"),
-            corner_radius=THEME.radii.button,
-            fg_color=(THEME.colors.primary_blue, THEME.colors.primary_blue),
-            hover_color=(THEME.colors.primary_blue_hover, THEME.colors.primary_blue_hover),
-        )
+        button.configure(**_PRIMARY_BUTTON_STYLE, font=shared_font(font_size, "bold"))
         button.pack_configure(fill="x", padx=6, pady=(2, 0))
     except Exception:
         pass
@@ -24,13 +42,7 @@ def style_primary_button(button, font_size=14):
 def style_accent_secondary_button(button, font_size=14):
     """Apply accent secondary button styling."""
     try:
-        button.configure(
-            height=40,
-            font=("Arial", font_size, "bold"),
-            corner_radius=THEME.radii.button,
-            fg_color=(THEME.colors.primary_blue, THEME.colors.primary_blue),
-            hover_color=(THEME.colors.primary_blue_hover, THEME.colors.primary_blue_hover),
-        )
+        button.configure(**_PRIMARY_BUTTON_STYLE, font=shared_font(font_size, "bold"))
         button.pack_configure(pady=(4, 0))
     except Exception:
         pass
@@ -39,28 +51,37 @@ def style_accent_secondary_button(button, font_size=14):
 def style_secondary_button(button, font_size=13):
     """Apply secondary button styling."""
     try:
-        button.configure(
-            height=40,
-            font=("Arial", font_size, "bold"),
-            corner_radius=THEME.radii.button,
-            fg_color=THEME.colors.secondary_gray,
-            hover_color=THEME.colors.secondary_gray_hover,
-            text_color=THEME.colors.text,
-        )
+        button.configure(**_SECONDARY_BUTTON_STYLE, font=shared_font(font_size, "bold"))
         button.pack_configure(pady=(4, 0))
     except Exception:
         pass
 
 
+@lru_cache(maxsize=1)
+def _dropdown_styles(_theme_name):
+    """Primary and secondary dropdown options for the loaded CTk colour theme."""
+    theme = ThemeManager.theme
+    primary = {
+        "corner_radius": THEME.radii.button,
+        "fg_color": (THEME.colors.primary_blue, THEME.colors.primary_blue),
+        "button_color": theme["CTkOptionMenu"]["button_color"],
+        "button_hover_color": theme["CTkOptionMenu"]["button_hover_color"],
+    }
+    secondary = {
+        "corner_radius": THEME.radii.button,
+        "text_color": THEME.colors.text,
+        "fg_color": theme["CTkComboBox"]["fg_color"],
+        "button_color": theme["CTkComboBox"]["button_color"],
+        "button_hover_color": theme["CTkComboBox"]["button_hover_color"],
+    }
+    return primary, secondary
+
+
 def style_primary_dropdown(dropdown):
     """Apply primary dropdown styling."""
     try:
-        dropdown.configure(
-            corner_radius=THEME.radii.button,
-            fg_color=(THEME.colors.primary_blue, THEME.colors.primary_blue),
-            button_color=ThemeManager.theme["CTkOptionMenu"]["button_color"],
-            button_hover_color=ThemeManager.theme["CTkOptionMenu"]["button_hover_color"],
-        )
+        # Keyed on the loaded theme's name or path, which set_default_color_theme updates.
+        dropdown.configure(**_dropdown_styles(ThemeManager._currently_loaded_theme)[0])
     except Exception:
         pass
 
@@ -68,12 +89,6 @@ def style_primary_dropdown(dropdown):
 def style_secondary_dropdown(dropdown):
     """Apply secondary dropdown styling."""
     try:
-        dropdown.configure(
-            corner_radius=THEME.radii.button,
-            text_color=THEME.colors.text,
-            fg_color=ThemeManager.theme["CTkComboBox"]["fg_color"],
-            button_color=ThemeManager.theme["CTkComboBox"]["button_color"],
-            button_hover_color=ThemeManager.theme["CTkComboBox"]["button_hover_color"],
-        )
+        dropdown.configure(**_dropdown_styles(ThemeManager._currently_loaded_theme)[1])
     except Exception:
         pass
@@ -9,15 +9,16 @@ This module provides card-style UI elements including:
 - PopupCard: Modal popup with overlay and trigger support
 - InfoBadge: Styled info badge with yellow/brown theme
 - LocationDropdownWithLabel: Location selection dropdown
-- StatCard: Metric display card value label
+- StatCard: Canvas-drawn metric display card
 - StatsGrid: Container for stat cards
 """
 
+import tkinter as tk
+
 import customtkinter as ctk
 from pages.components.config.theme import THEME
-from database_operations.database_repositories import get_all_cities
 from pages.components.style_utils import style_secondary_dropdown
-from pages.components.ui_controls_utils import content_separator
+from pages.components.ui_controls_utils import content_separator, get_location_options
 
 
 class FunctionCard(ctk.CTkFrame):
@@ -70,33 +71,56 @@ class ActionButton(ctk.CTkButton):
 
 
 class PopupCard:
-    """Popup overlay helper with optional trigger button and open callback."""
+    """Popup overlay helper with optional trigger button and open callback.
+
+    The overlay chrome (shell, header and close button) is built on first open
+    and kept hidden between opens; only the content frame's children are rebuilt.
+    """
 
     def __init__(self, parent, title, small=False, button_text="Open", button_size="medium", generate_button=True):
         self.parent = parent
+        self.top_level = parent.winfo_toplevel()
         self.title = title
         self.small = small
         self.overlay = None
         self.popup = None
+        self.content = None
         self.button = ActionButton(parent, button_text, self.open_popup, size=button_size) if generate_button else None
 
+        # The overlay lives on the toplevel, so it must not outlive the owning page.
+        # Bound on the Tk widget itself (CTk frames redirect bind() to their canvas),
+        # and filtered because a toplevel parent also sees its descendants' <Destroy>.
+        tk.Misc.bind(parent, "<Destroy>", self._on_parent_destroy, "+")
+
     def __iter__(self):
         yield self.button
         yield self.open_popup
 
+    def _clear_content(self):
+        for widget in self.content.winfo_children():
+            widget.destroy()
+
     def close_popup(self):
         if self.overlay:
-            self.overlay.destroy()
-            self.overlay = None
-            self.popup = None
+            self.overlay.place_forget()
+            self._clear_content()
 
-    def open_popup(self):
-        self.close_popup()
+    def _on_parent_destroy(self, event):
+        if event.widget is self.parent:
+            self._destroy_chrome()
+
+    def _destroy_chrome(self):
+        if self.overlay:
+            try:
+                self.overlay.destroy()
+            except Exception:
+                pass
+        self.overlay = None
+        self.popup = None
+        self.content = None
 
-        top_level = self.parent.winfo_toplevel()
-        overlay = ctk.CTkFrame(top_level, fg_color="transparent")
-        overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
-        overlay.lift()
+    def _build_chrome(self):
+        overlay = ctk.CTkFrame(self.top_level, fg_color="transparent")
         overlay.bind("<Button-1>", lambda e: self.close_popup())
 
         popup = ctk.CTkFrame(overlay, corner_radius=10)
@@ -104,9 +128,6 @@ class PopupCard:
             popup.place(relx=0.015, rely=0.015, relwidth=0.97, relheight=0.97)
         else:
             popup.place(relx=0.5, rely=0.5, anchor="center")
-
-        self.overlay = overlay
-        self.popup = popup
         popup.bind("<Button-1>", lambda e: "break")
 
         header = ctk.CTkFrame(popup, fg_color="transparent")
@@ -136,7 +157,20 @@ class PopupCard:
 
         content = ctk.CTkFrame(popup, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=15, pady=(5, 15))
-        return content
+
+        self.overlay = overlay
+        self.popup = popup
+        self.content = content
+
+    def open_popup(self):
+        if self.overlay is None or not self.overlay.winfo_exists():
+            self._build_chrome()
+        else:
+            self._clear_content()
+
+        self.overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.overlay.lift()
+        return self.content
 
 
 class InfoBadge(ctk.CTkLabel):
@@ -171,48 +205,112 @@ class LocationDropdownWithLabel(ctk.CTkComboBox):
             text_color=THEME.colors.text,
         ).pack(side="left", padx=(0, 10))
 
-        try:
-            cities = ["All Locations"] + get_all_cities()
-        except Exception as e:
-            print(f"Error loading cities: {e}")
-            cities = ["All Locations"]
-
-        super().__init__(location_wrap, values=cities, width=240, font=("Arial", 13))
+        super().__init__(location_wrap, values=get_location_options(), width=240, font=("Arial", 13))
         self.set(initial_value)
         self.pack(side="left")
         style_secondary_dropdown(self)
 
 
-class StatCard(ctk.CTkLabel):
-    """Metric value label inside a standardized stat card."""
+class StatCard(ctk.CTkFrame):
+    """Standardized stat card drawing its title and metric value on its own canvas.
+
+    `configure(text=..., text_color=..., font=...)` updates the value, so callers
+    treat it like a label. Text wider than the card is cut short with an ellipsis.
+    """
+
+    HEIGHT = 76
+    PADX = 12
+    TITLE_FONT = ("Arial", 11, "bold")
+    VALUE_FONT = ("Arial", 20, "bold")
+    TITLE_COLOR = ("gray45", "gray70")
+    VALUE_COLOR = ("#3B8ED0", "#3B8ED0")
+
+    _value_id = None
 
     def __init__(self, parent, title: str, default_value: str = "0"):
-        card = ctk.CTkFrame(
+        super().__init__(
             parent,
+            height=self.HEIGHT,
             corner_radius=THEME.radii.box,
             fg_color=("gray92", "gray17"),
             border_width=1,
             border_color=THEME.colors.secondary_gray,
         )
-        card.pack(side="left", expand=True, fill="both", padx=6, ipadx=8, ipady=10)
-        self.card = card
-
-        ctk.CTkLabel(
-            card,
-            text=title.upper(),
-            font=("Arial", 11, "bold"),
-            text_color=("gray45", "gray70"),
-            anchor="w",
-        ).pack(fill="x", padx=12, pady=(8, 0))
-
-        super().__init__(
-            card,
-            text=default_value,
-            font=("Arial", 20, "bold"),
-            text_color=("#3B8ED0", "#3B8ED0"),
-            anchor="w",
+        self.pack(side="left", expand=True, fill="both", padx=6)
+        self.card = self
+
+        self._title = title.upper()
+        self._value = default_value
+        self._value_font = self.VALUE_FONT
+        self._value_color = self.VALUE_COLOR
+        self._title_id = self._canvas.create_text(0, 0, anchor="nw", tags="stat_text")
+        self._value_id = self._canvas.create_text(0, 0, anchor="nw", tags="stat_text")
+        self._layout_text()
+
+    def _fit_text(self, text, font, max_width):
+        """Return text shortened with an ellipsis to fit max_width pixels."""
+        def width(value):
+            return int(self._canvas.tk.call("font", "measure", font, value))
+
+        if width(text) <= max_width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if width(text[:mid].rstrip() + "…") <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low].rstrip() + "…"
+
+    def _layout_text(self):
+        x = self._apply_widget_scaling(self.PADX)
+        max_width = self._apply_widget_scaling(self._current_width - 2 * self.PADX)
+        title_font = self._apply_font_scaling(self.TITLE_FONT)
+        value_font = self._apply_font_scaling(self._value_font)
+        self._canvas.coords(self._title_id, x, self._apply_widget_scaling(16))
+        self._canvas.coords(self._value_id, x, self._apply_widget_scaling(34))
+        self._canvas.itemconfigure(
+            self._title_id,
+            text=self._fit_text(self._title, title_font, max_width),
+            font=title_font,
+            fill=self._apply_appearance_mode(self.TITLE_COLOR),
+        )
+        self._canvas.itemconfigure(
+            self._value_id,
+            text=self._fit_text(self._value, value_font, max_width),
+            font=value_font,
+            fill=self._apply_appearance_mode(self._value_color),
         )
-        self.pack(fill="x", padx=12, pady=(2, 8))
+        # The frame's redraw can recreate its background shapes above the text.
+        self._canvas.tag_raise("stat_text")
+
+    def _draw(self, *args, **kwargs):
+        super()._draw(*args, **kwargs)
+        # Runs on resize, scaling and appearance changes; skipped during CTkFrame.__init__.
+        if self._value_id is not None:
+            self._layout_text()
+
+    def configure(self, require_redraw=False, **kwargs):
+        label_options = {"text": "_value", "text_color": "_value_color", "font": "_value_font"}
+        changed = False
+        for option, attribute in label_options.items():
+            if option in kwargs:
+                setattr(self, attribute, kwargs.pop(option))
+                changed = True
+        if changed:
+            self._layout_text()
+        if kwargs:
+            super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str):
+        if attribute_name == "text":
+            return self._value
+        if attribute_name == "text_color":
+            return self._value_color
+        if attribute_name == "font":
+            return self._value_font
+        return super().cget(attribute_name)
 
 
 class StatsGrid(ctk.CTkFrame):
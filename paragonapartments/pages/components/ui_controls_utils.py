@@ -2,12 +2,56 @@
 
 UI controls helpers for reusable widgets and layout elements."""
 
+import time
+from functools import lru_cache
+
 import customtkinter as ctk
 
 from pages.components.config.theme import THEME
 from pages.components.scrollable_option_menu import ScrollableDropdown
-from pages.components.style_utils import style_secondary_dropdown
-from database_operations.database_repositories import get_all_cities
+from pages.components.style_utils import shared_font, style_secondary_dropdown
+
+CITIES_CACHE_TTL_SECONDS = 60
+_SEPARATOR_COLOR = "gray35"
+
+
+@lru_cache(maxsize=1)
+def _cached_cities(_time_bucket):
+    # Imported on first use so loading the UI helpers does not pull in the database layer.
+    from database_operations.database_repositories import get_all_cities
+
+    return tuple(get_all_cities())
+
+
+@lru_cache(maxsize=1)
+def _cached_location_options(_time_bucket):
+    return ("All Locations", *_cached_cities(_time_bucket))
+
+
+def get_location_options():
+    """Return the shared ("All Locations", *cities) tuple for location dropdowns."""
+    try:
+        return _cached_location_options(int(time.time() // CITIES_CACHE_TTL_SECONDS))
+    except Exception as e:
+        print(f"Error loading cities: {e}")
+        return ("All Locations",)
+
+
+def load_location_options_when_idle(dropdown):
+    """Fill a location dropdown after the current draw, so opening a popup never waits on the city query."""
+
+    def load():
+        if dropdown.winfo_exists():
+            dropdown.configure(values=get_location_options())
+
+    dropdown.after_idle(load)
+
+
+def invalidate_city_cache():
+    """Drop the cached city list; call after a location is added, edited or deleted."""
+    _cached_cities.cache_clear()
+    _cached_location_options.cache_clear()
+
 
 def normalize_location_value(location_value: str | None, all_value: str = "all") -> str:
     """Normalize UI location values to repository-friendly values."""
@@ -34,17 +78,32 @@ def create_refresh_button(parent, command, side="left", padx=(12, 0), square=Fal
 
 def create_debounced_refresh(widget, callback, delay_ms=150):
     """Create a debounced refresh function for dropdowns."""
-    refresh_timer = {"id": None}
+    last_change = 0.0
+    last_choice = None
+    timer_id = None
+
+    def run_when_quiet():
+        # One timer per burst: later changes only move last_change, and the timer
+        # re-arms itself for whatever is left of the quiet period.
+        nonlocal timer_id
+        remaining_ms = delay_ms - (time.monotonic() - last_change) * 1000
+        if remaining_ms > 0:
+            timer_id = widget.after(int(remaining_ms) + 1, run_when_quiet)
+            return
+        timer_id = None
+        callback()
 
     def schedule_refresh(_choice=None):
-        if refresh_timer["id"] is not None:
-            try:
-                widget.after_cancel(refresh_timer["id"])
-            except Exception:
-                pass
-        refresh_timer["id"] = widget.after(delay_ms, callback)
+        nonlocal last_change, last_choice, timer_id
+        # A repeat of the choice already waiting to refresh changes nothing.
+        if timer_id is not None and _choice is not None and _choice == last_choice:
+            return
+        last_choice = _choice
+        last_change = time.monotonic()
+        if timer_id is None:
+            timer_id = widget.after(delay_ms, run_when_quiet)
 
-    return refresh_timer, schedule_refresh
+    return schedule_refresh
 
 
 def create_popup_header_with_location(content):
@@ -52,33 +111,28 @@ def create_popup_header_with_location(content):
     header = ctk.CTkFrame(content, fg_color="transparent")
     header.pack(fill="x", padx=10, pady=(5, 10))
 
-    ctk.CTkLabel(header, text="Location:", font=("Arial", 14, "bold")).pack(
+    ctk.CTkLabel(header, text="Location:", font=shared_font(14, "bold")).pack(
         side="left", padx=(0, 8)
     )
 
-    try:
-        cities = ["All Locations"] + get_all_cities()
-    except Exception as e:
-        print(f"Error loading cities: {e}")
-        cities = ["All Locations"]
-
-    location_dropdown = ctk.CTkComboBox(header, values=cities, width=220, font=("Arial", 13))
+    location_dropdown = ctk.CTkComboBox(header, values=("All Locations",), width=220, font=shared_font(13))
     location_dropdown.set("All Locations")
     location_dropdown.pack(side="left")
+    load_location_options_when_idle(location_dropdown)
 
     return header, location_dropdown
 
 
 def content_separator(parent, pady=(5, 10), padx=15):
     """Add a visual separator line."""
-    separator = ctk.CTkFrame(parent, height=2, fg_color="gray35")
+    separator = ctk.CTkFrame(parent, height=2, fg_color=_SEPARATOR_COLOR)
     separator.pack(fill="x", pady=pady, padx=padx)
     return separator
 
 
 def vertical_divider(parent, pady=5, padx=(0, 5)):
     """Add a vertical separator line."""
-    separator = ctk.CTkFrame(parent, width=2, height=1, fg_color="gray35")
+    separator = ctk.CTkFrame(parent, width=2, height=1, fg_color=_SEPARATOR_COLOR)
     separator.pack(fill="y", side="left", padx=padx, pady=pady)
     return separator
 
@@ -97,7 +151,7 @@ def create_dynamic_dropdown_with_refresh(
         container,
         values=["Loading..."],
         dropdown_max_visible_rows=10,
-        font=("Arial", 12),
+        font=shared_font(12),
     )
     dropdown.pack(side="left", expand=True, fill="x", pady=0)
     dropdown.set("Loading...")
@@ -115,12 +169,10 @@ def create_dynamic_dropdown_with_refresh(
                 data_map.clear()
                 return
 
-            options = []
+            pairs = [display_formatter(item) for item in data]
+            options = [display for display, _ in pairs]
             data_map.clear()
-            for item in data:
-                display, value = display_formatter(item)
-                options.append(display)
-                data_map[display] = value
+            data_map.update(pairs)
 
             dropdown.configure(values=options)
             dropdown.set(options[0])
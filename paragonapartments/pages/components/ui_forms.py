@@ -10,17 +10,36 @@ This module provides comprehensive form building functionality including:
 - Built-in validation and error handling
 """
 
+from functools import partial
+
 import customtkinter as ctk
 from pages.components.config.theme import THEME
 import pages.components.input_validation as input_validation
 from pages.components.date_utils import open_date_picker
-from pages.components.style_utils import style_primary_dropdown
+from pages.components.style_utils import shared_font, style_primary_dropdown
 from pages.components.ui_controls_utils import create_dynamic_dropdown_with_refresh
 
+_SUBMIT_BUTTON_COLORS = {
+    "fg_color": (THEME.colors.primary_blue, THEME.colors.primary_blue),
+    "hover_color": (THEME.colors.primary_blue_hover, THEME.colors.primary_blue_hover),
+    "text_color": ("white", "white"),
+}
+
 
 class Form:
     """Builds and manages a themed form with validation and submission flow."""
 
+    # Merged under each field spec once, so the build loop can index keys directly.
+    FIELD_DEFAULTS = {
+        "type": "text",
+        "subtype": "text",
+        "default": "",
+        "required": False,
+        "small": False,
+        "show_label": True,
+        "placeholder": None,
+    }
+
     def __init__(
         self,
         parent,
@@ -44,11 +63,14 @@ class Form:
         self.row_pady = 3
 
         self.form = None
-        self.error_label = None
-        self.success_label = None
+        self.message_label = None
+        self._toplevel = None
         self.field_widgets = {}
         self.dynamic_dropdown_refreshers = {}
         self.dynamic_dropdown_maps = {}
+        self._required_collectors = []
+        self._optional_collectors = []
+        self._resetters = []
 
         # Standardized pattern: construction creates the component immediately.
         self.form = ctk.CTkFrame(self.parent, fg_color="transparent")
@@ -56,7 +78,7 @@ class Form:
 
         self._create_title()
         self._create_fields()
-        self._create_message_labels()
+        self._build_submit_plan()
         self._create_submit_button()
 
     def _create_title(self):
@@ -64,7 +86,7 @@ class Form:
             ctk.CTkLabel(
                 self.form,
                 text=self.name,
-                font=("Arial", 13, "bold"),
+                font=shared_font(13, "bold"),
                 anchor="w",
             ).pack(padx=5, pady=0)
 
@@ -72,150 +94,183 @@ class Form:
         fields_count = 0
         current_row = None
 
+        # With one field per row a row frame would only wrap a single field frame,
+        # so field frames are stacked straight into the form instead.
+        single_column = self.field_per_row == 1
+
         for field in self.fields:
-            if fields_count % self.field_per_row == 0:
+            field = {**self.FIELD_DEFAULTS, **field}
+            if not single_column and fields_count % self.field_per_row == 0:
                 current_row = ctk.CTkFrame(self.form, fg_color="transparent")
                 current_row.pack(fill="x", pady=self.row_pady, padx=5)
 
             field_name = field["name"]
-            field_type = field.get("type", "text")
-            field_subtype = field.get("subtype", "text")
-            field_default = field.get("default", "")
-            field_required = field.get("required", False)
-            small_field = field.get("small", False)
-
-            field_frame = ctk.CTkFrame(current_row, fg_color="transparent")
-            field_frame.pack(
-                fill="x" if not small_field else None,
-                padx=5,
-                side="left",
-                expand=not small_field,
-            )
-
-            if field.get("show_label", True):
+            field_type = field["type"]
+            field_subtype = field["subtype"]
+            field_default = field["default"]
+            field_required = field["required"]
+            small_field = field["small"]
+
+            if single_column:
+                field_frame = ctk.CTkFrame(self.form, fg_color="transparent")
+                field_frame.pack(
+                    fill="x" if not small_field else None,
+                    anchor="w",
+                    padx=10,
+                    pady=self.row_pady,
+                )
+            else:
+                field_frame = ctk.CTkFrame(current_row, fg_color="transparent")
+                field_frame.pack(
+                    fill="x" if not small_field else None,
+                    padx=5,
+                    side="left",
+                    expand=not small_field,
+                )
+
+            if field["show_label"]:
                 ctk.CTkLabel(
                     field_frame,
                     text=field_name + ("*" if field_required else ""),
-                    font=("Arial", self.input_font_size),
+                    font=shared_font(self.input_font_size),
                     height=1,
                 ).pack(anchor="w", pady=(0, 2), padx=(3, 0))
 
             widget = self._create_field_widget(field_frame, field, field_type, field_subtype)
             self._apply_default_value(widget, field_default, field_type, field_subtype, field)
 
-            self.field_widgets[field_name] = {
+            field_info = {
                 "widget": widget,
                 "type": field_type,
                 "subtype": field_subtype,
                 "required": field_required,
             }
+            if field_type == "dropdown" and field_subtype != "dynamic":
+                options = field.get("options", [])
+                # Kept here so clearing after a submit doesn't need to search self.fields.
+                field_info["default_option"] = options[0] if options and isinstance(options, list) else None
+            self.field_widgets[field_name] = field_info
             fields_count += 1
 
     def _create_field_widget(self, field_frame, field, field_type, field_subtype):
-        if field_type == "text":
-            return self._create_text_widget(field_frame, field, field_subtype)
-
-        if field_type == "dropdown":
-            return self._create_dropdown_widget(field_frame, field, field_subtype)
-
-        if field_type == "checkbox":
-            return self._create_checkbox_widget(field_frame)
-
-        return ctk.CTkEntry(field_frame)
-
-    def _create_text_widget(self, field_frame, field, field_subtype):
-        entry_kwargs = {
-            "placeholder_text": field.get("placeholder", None),
+        builder = self.FIELD_BUILDERS.get((field_type, field_subtype)) or self.FIELD_BUILDERS.get((field_type, None))
+        if builder is None:
+            return ctk.CTkEntry(field_frame)
+        return builder(self, field_frame, field)
+
+    def _entry_kwargs(self, field):
+        return {
+            "placeholder_text": field["placeholder"],
             "height": self.input_height,
-            "font": ("Arial", self.input_font_size),
+            "font": shared_font(self.input_font_size),
             "corner_radius": THEME.radii.input,
         }
-        widget = ctk.CTkEntry(field_frame, **entry_kwargs)
 
-        if field_subtype == "password":
-            widget.configure(show="•")
+    def _create_text_widget(self, field_frame, field, **entry_options):
+        widget = ctk.CTkEntry(field_frame, **self._entry_kwargs(field), **entry_options)
+        widget.pack(fill="x")
+        return widget
 
-        elif field_subtype == "number":
-            vcmd = (widget.register(input_validation.validate_number_input), "%P")
-            widget.configure(validate="key", validatecommand=vcmd, require_redraw=True)
-            self._bind_placeholder_on_focusout(widget)
+    def _create_password_widget(self, field_frame, field):
+        return self._create_text_widget(field_frame, field, show="•")
 
-        elif field_subtype == "currency":
-            vcmd = (widget.register(input_validation.validate_currency_input), "%P")
-            widget.configure(validate="key", validatecommand=vcmd)
-            self._bind_placeholder_on_focusout(widget)
+    def _validation_options(self, parent, field, validator):
+        return {
+            "validate": "key",
+            "validatecommand": input_validation.validator_command(parent, validator, field["placeholder"]),
+        }
 
-        elif field_subtype == "date":
-            return self._create_date_widget(field_frame, entry_kwargs)
+    def _create_number_widget(self, field_frame, field):
+        return self._create_text_widget(
+            field_frame, field,
+            **self._validation_options(field_frame, field, input_validation.validate_number_input),
+        )
 
-        widget.pack(fill="x")
-        return widget
+    def _create_currency_widget(self, field_frame, field):
+        return self._create_text_widget(
+            field_frame, field,
+            **self._validation_options(field_frame, field, input_validation.validate_currency_input),
+        )
 
-    def _create_date_widget(self, field_frame, entry_kwargs):
+    def _create_date_widget(self, field_frame, field):
         date_row = ctk.CTkFrame(field_frame, fg_color="transparent")
         date_row.pack(fill="x", expand=True)
 
-        entry_kwargs["width"] = 140
-        widget = ctk.CTkEntry(date_row, **entry_kwargs)
-        vcmd = (widget.register(input_validation.validate_date_input), "%P")
-        widget.configure(validate="key", validatecommand=vcmd)
+        widget = ctk.CTkEntry(
+            date_row, width=140, **self._entry_kwargs(field),
+            **self._validation_options(date_row, field, input_validation.validate_date_input),
+        )
         widget.pack(side="left", fill="x", expand=True)
 
-        def open_calendar(target_widget=widget):
-            open_date_picker(target_widget, self.parent.winfo_toplevel())
+        # Resolved once per form rather than on every calendar click.
+        if self._toplevel is None:
+            self._toplevel = self.parent.winfo_toplevel()
+
+        def open_calendar(target_widget=widget, toplevel=self._toplevel):
+            open_date_picker(target_widget, toplevel)
 
         ctk.CTkButton(
             date_row,
             text="📅",
             width=30,
             height=30,
-            font=("Arial", 13),
+            font=shared_font(13),
             command=open_calendar,
             fg_color=THEME.colors.secondary_gray,
             hover_color=THEME.colors.secondary_gray_hover,
             text_color=THEME.colors.text,
         ).pack(side="left", padx=(6, 0))
 
-        self._bind_placeholder_on_focusout(widget)
         return widget
 
-    def _create_dropdown_widget(self, field_frame, field, field_subtype):
-        if field_subtype == "dynamic":
-            options_config = field.get("options", {})
-            data_fetcher = options_config.get("data_fetcher")
-            display_formatter = options_config.get("display_formatter", lambda x: (str(x), x))
-            empty_message = options_config.get("empty_message", "No items available")
-
-            widget, data_map, refresh_func = create_dynamic_dropdown_with_refresh(
-                parent=field_frame,
-                data_fetcher=data_fetcher,
-                display_formatter=display_formatter,
-                empty_message=empty_message,
-            )
-            self.dynamic_dropdown_maps[field["name"]] = data_map
-            self.dynamic_dropdown_refreshers[field["name"]] = refresh_func
-            return widget
+    def _create_dynamic_dropdown_widget(self, field_frame, field):
+        options_config = field.get("options", {})
+        data_fetcher = options_config.get("data_fetcher")
+        display_formatter = options_config.get("display_formatter", lambda x: (str(x), x))
+        empty_message = options_config.get("empty_message", "No items available")
+
+        widget, data_map, refresh_func = create_dynamic_dropdown_with_refresh(
+            parent=field_frame,
+            data_fetcher=data_fetcher,
+            display_formatter=display_formatter,
+            empty_message=empty_message,
+        )
+        self.dynamic_dropdown_maps[field["name"]] = data_map
+        self.dynamic_dropdown_refreshers[field["name"]] = refresh_func
+        return widget
 
-        options = field.get("options", [])
+    def _create_dropdown_widget(self, field_frame, field):
         widget = ctk.CTkOptionMenu(
             field_frame,
-            values=options,
+            values=field.get("options", []),
             height=self.input_height,
-            font=("Arial", self.input_font_size),
+            font=shared_font(self.input_font_size),
         )
         style_primary_dropdown(widget)
         widget.pack(fill="x")
         return widget
 
-    def _create_checkbox_widget(self, field_frame):
+    def _create_checkbox_widget(self, field_frame, field):
         widget = ctk.CTkCheckBox(
             field_frame,
             text="",
-            font=("Arial", self.input_font_size),
+            font=shared_font(self.input_font_size),
         )
         widget.pack(anchor="w")
         return widget
 
+    # (type, subtype) -> builder; (type, None) is the fallback for any other subtype.
+    FIELD_BUILDERS = {
+        ("text", None): _create_text_widget,
+        ("text", "password"): _create_password_widget,
+        ("text", "number"): _create_number_widget,
+        ("text", "currency"): _create_currency_widget,
+        ("text", "date"): _create_date_widget,
+        ("dropdown", None): _create_dropdown_widget,
+        ("dropdown", "dynamic"): _create_dynamic_dropdown_widget,
+        ("checkbox", None): _create_checkbox_widget,
+    }
+
     def _apply_default_value(self, widget, default_value, field_type, field_subtype, field):
         if field_type == "text" and default_value:
             widget.insert(0, str(default_value))
@@ -232,32 +287,23 @@ class Form:
             elif options:
                 widget.set(options[0])
 
-    @staticmethod
-    def _bind_placeholder_on_focusout(widget):
-        def on_focusout(_event, w=widget):
-            if not w.get():
-                w.configure(validate="none")
-                w.delete(0, "end")
-                w.configure(validate="key")
-
-        widget.bind("<FocusOut>", on_focusout)
-
-    def _create_message_labels(self):
-        self.error_label = ctk.CTkLabel(
-            self.form,
-            text="",
-            font=("Arial", 12),
-            text_color="red",
-            wraplength=400,
-        )
+    def _show_message(self, text, color):
+        # One message label shared by errors and success, created on the first message,
+        # so forms that never report anything don't build it at all.
+        if self.message_label is None:
+            self.message_label = ctk.CTkLabel(
+                self.form,
+                text="",
+                font=shared_font(12),
+                wraplength=400,
+            )
+        self.message_label.configure(text=text, text_color=color)
+        self.message_label.pack(pady=0, padx=10)
 
-        self.success_label = ctk.CTkLabel(
-            self.form,
-            text="",
-            font=("Arial", 12),
-            text_color="green",
-            wraplength=400,
-        )
+    def _clear_message(self):
+        # Unpacked rather than blanked, so an empty label doesn't keep its row of height.
+        if self.message_label is not None:
+            self.message_label.pack_forget()
 
     def _create_submit_button(self):
         submit_button = ctk.CTkButton(
@@ -265,41 +311,56 @@ class Form:
             text=self.submit_text,
             command=self._handle_submit,
             height=self.button_height,
-            font=("Arial", self.button_font_size, "bold"),
+            font=shared_font(self.button_font_size, "bold"),
             corner_radius=THEME.radii.button,
-            fg_color=(THEME.colors.primary_blue, THEME.colors.primary_blue),
-            hover_color=(THEME.colors.primary_blue_hover, THEME.colors.primary_blue_hover),
-            text_color=("white", "white"),
+            **_SUBMIT_BUTTON_COLORS,
         )
         submit_button.pack(pady=(10, 5), padx=10, fill="x")
 
-    def _collect_values(self):
-        values = {}
+    def _build_submit_plan(self):
+        """Resolve each field's value getter and reset action once, so submits don't dispatch on type."""
+        self._required_collectors = []
+        self._optional_collectors = []
+        self._resetters = []
         for field_name, field_info in self.field_widgets.items():
             widget = field_info["widget"]
             field_type = field_info["type"]
-            required = field_info["required"]
 
             if field_type == "text":
-                value = widget.get().strip()
+                getter = lambda w=widget: w.get().strip()
+                self._resetters.append(lambda w=widget: w.delete(0, "end"))
             elif field_type == "dropdown":
-                display_value = widget.get()
-                if field_name in self.dynamic_dropdown_maps:
-                    value = self.dynamic_dropdown_maps[field_name].get(display_value, display_value)
+                data_map = self.dynamic_dropdown_maps.get(field_name)
+                if data_map is not None:
+                    # The map is refreshed in place, so holding the dict keeps lookups current.
+                    getter = lambda w=widget, m=data_map: m.get(value := w.get(), value)
                 else:
-                    value = display_value
+                    getter = widget.get
+                if field_info.get("default_option") is not None:
+                    self._resetters.append(partial(widget.set, field_info["default_option"]))
             elif field_type == "checkbox":
-                value = widget.get() == 1
+                getter = lambda w=widget: w.get() == 1
+                self._resetters.append(widget.deselect)
             else:
-                value = None
+                getter = lambda: None
 
-            if required and (value == "" or value is None):
-                self.error_label.configure(text=f"Error: {field_name} is required")
-                self.error_label.pack(pady=0, padx=10)
-                return None
+            if field_info["required"]:
+                self._required_collectors.append((field_name, getter))
+            else:
+                self._optional_collectors.append((field_name, getter))
 
+    def _collect_values(self):
+        """Return the field values, or the name of the first empty required field."""
+        # Keys are seeded in field order; required fields are read first so a missing
+        # one stops the submit before the remaining widgets are queried.
+        values = dict.fromkeys(self.field_widgets)
+        for field_name, getter in self._required_collectors:
+            value = getter()
+            if value == "" or value is None:
+                return field_name
             values[field_name] = value
 
+        values.update((field_name, getter()) for field_name, getter in self._optional_collectors)
         return values
 
     def _refresh_dynamic_dropdowns(self):
@@ -307,38 +368,25 @@ class Form:
             refresh_func()
 
     def _clear_fields_after_success(self):
-        for field_name, field_info in self.field_widgets.items():
-            widget = field_info["widget"]
-            field_type = field_info["type"]
-            sub_type = field_info.get("subtype", None)
-
-            if field_type == "text":
-                widget.delete(0, "end")
-            elif field_type == "checkbox":
-                widget.deselect()
-            elif field_type == "dropdown" and sub_type != "dynamic":
-                field_def = next((f for f in self.fields if f["name"] == field_name), None)
-                if field_def:
-                    options = field_def.get("options", [])
-                    if options and isinstance(options, list):
-                        widget.set(options[0])
+        for reset in self._resetters:
+            reset()
 
     def _handle_submit(self):
-        self.error_label.pack_forget()
-        self.success_label.pack_forget()
+        self._clear_message()
 
         values = self._collect_values()
-        if values is None or not self.on_submit:
+        if isinstance(values, str):
+            self._show_message(f"Error: {values} is required", "red")
+            return
+        if not self.on_submit:
             return
 
         result = self.on_submit(values)
 
         if isinstance(result, str):
-            self.error_label.configure(text=result)
-            self.error_label.pack(pady=0, padx=10)
+            self._show_message(result, "red")
             self.form.after(50, self._refresh_dynamic_dropdowns)
         elif result is True:
-            self.success_label.configure(text="Operation completed successfully.")
-            self.success_label.pack(pady=0, padx=10)
+            self._show_message("Operation completed successfully.", "green")
             self.form.after(50, self._refresh_dynamic_dropdowns)
             self._clear_fields_after_success()
@@ -4,6 +4,8 @@ Contributors: Ahmed AlShamy (24045361)
 Data table UI components for displaying and managing tabular data.
 
 This module provides class-based table building functionality including:
+- TableHeaderRow: Header frame drawing column dividers on its canvas
+- TableRow: Row frame drawing its cell values as canvas text
 - DataTable: Full-featured table with CRUD operations and pagination
 - TablePopupWithHeader: Shared popup table wiring with optional header controls
 - EditableTablePopup: Standardized edit popup with optional location filter
@@ -11,23 +13,254 @@ This module provides class-based table building functionality including:
 """
 
 import inspect
+import time
+from functools import lru_cache, partial
 
 import customtkinter as ctk
+from customtkinter import ThemeManager
 
 import pages.components.input_validation as input_validation
 from pages.components.config.theme import THEME
+from pages.components.style_utils import shared_font
 from pages.components.ui_controls_utils import (
     create_debounced_refresh,
     normalize_location_value,
     create_popup_header_with_location,
     create_refresh_button,
-    vertical_divider,
 )
 
+_SECONDARY_BUTTON_COLORS = {
+    "fg_color": THEME.colors.secondary_gray,
+    "hover_color": THEME.colors.secondary_gray_hover,
+    "text_color": THEME.colors.text,
+}
+_PAGER_BUTTON_STYLE = {
+    **_SECONDARY_BUTTON_COLORS,
+    "height": 32,
+    "text_color_disabled": THEME.colors.disabled_text,
+}
+# Amounts such as rents and zero balances repeat heavily across rows and refreshes.
+_format_currency = lru_cache(maxsize=4096)(input_validation.format_currency_display)
+_ENTRY_VALIDATORS = {
+    "number": input_validation.validate_number_input,
+    "currency": input_validation.validate_currency_input,
+    "date": input_validation.validate_date_input,
+}
+
+
+class TableHeaderRow(ctk.CTkFrame):
+    """Header frame that draws its column dividers as lines on its own canvas."""
+
+    DIVIDER_SPACE = 10
+    DIVIDER_WIDTH = 2
+    DIVIDER_PADY = 5
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self._divider_cells = []
+        self.bind("<Configure>", lambda _event: self.after_idle(self._draw_dividers))
+
+    def add_divider_after(self, cell):
+        """Draw a divider line in the right padding of a packed header cell."""
+        self._divider_cells.append(cell)
+
+    def _draw_dividers(self):
+        if not self.winfo_exists():
+            return
+        self._canvas.delete("column_divider")
+        height = self.winfo_height()
+        for cell in self._divider_cells:
+            # Line sits after the cell's own 5px padding, inside DIVIDER_SPACE.
+            x = cell.winfo_x() + cell.winfo_width() + 5 + self.DIVIDER_WIDTH // 2
+            self._canvas.create_line(
+                x,
+                self.DIVIDER_PADY,
+                x,
+                height - self.DIVIDER_PADY,
+                fill="gray35",
+                width=self.DIVIDER_WIDTH,
+                tags="column_divider",
+            )
+
+
+# Measured text widths per scaled font; cell values repeat a lot across rows and pages.
+_TEXT_WIDTHS = {}
+_TEXT_WIDTHS_PER_FONT = 8192
+
+
+class TableRow(ctk.CTkFrame):
+    """Row frame that draws its cell values as text on its own canvas.
+
+    Cells are canvas text items rather than a frame and label each; edit widgets
+    are placed over a cell while it is being edited. Text that is wider than its
+    column is cut short with an ellipsis, since rows have a fixed height.
+    """
+
+    HEIGHT = 38
+    CELL_PADX = 5
+
+    def __init__(self, master, col_keys, col_widths, font=("Arial", 12)):
+        super().__init__(master, fg_color="transparent", height=self.HEIGHT)
+        # Rows keep a fixed height, so packing action buttons never propagates a resize.
+        self.pack_propagate(False)
+        self._text_color = ThemeManager.theme["CTkLabel"]["text_color"]
+        self._cell_font = font
+        self._cells = {}
+        self._texts = {}
+        self._scaled_font = None
+        self.row_data = None
+        self.editing = False
+        self.edit_btn = None
+        self.delete_btn = None
+
+        x = 0
+        for key, width in zip(col_keys, col_widths):
+            x += self.CELL_PADX
+            item = self._canvas.create_text(0, 0, anchor="w", tags="cell_text")
+            self._cells[key] = (item, x, width)
+            x += width + self.CELL_PADX
+
+        self._layout_cells()
+
+    def _layout_cells(self):
+        mid_y = self._apply_widget_scaling(self.HEIGHT) / 2
+        font = self._scaled_font = self._apply_font_scaling(self._cell_font)
+        fill = self._apply_appearance_mode(self._text_color)
+        for key, (item, x, width) in self._cells.items():
+            self._canvas.coords(item, self._apply_widget_scaling(x), mid_y)
+            self._canvas.itemconfigure(item, font=font, fill=fill)
+            if key in self._texts:
+                self.set_text(key, self._texts[key])
+
+    def _text_width(self, text):
+        widths = _TEXT_WIDTHS.setdefault(self._scaled_font, {})
+        width = widths.get(text)
+        if width is None:
+            if len(widths) >= _TEXT_WIDTHS_PER_FONT:
+                widths.clear()
+            width = widths[text] = int(self._canvas.tk.call("font", "measure", self._scaled_font, text))
+        return width
+
+    def _fit_text(self, text, max_width):
+        """Return text on one line, shortened with an ellipsis to fit max_width pixels."""
+        text = " ".join(text.splitlines())
+        if self._text_width(text) <= max_width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._text_width(text[:mid].rstrip() + "…") <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low].rstrip() + "…"
+
+    def _draw(self, *args, **kwargs):
+        super()._draw(*args, **kwargs)
+        # CTkFrame's redraw can recreate its background shapes above the cell text.
+        self._canvas.tag_raise("cell_text")
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+        self._layout_cells()
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._canvas.itemconfigure("cell_text", fill=self._apply_appearance_mode(self._text_color))
+
+    def set_text(self, key, text):
+        item, _x, width = self._cells[key]
+        self._texts[key] = text
+        self._canvas.itemconfigure(item, text=self._fit_text(text, self._apply_widget_scaling(width)))
+
+    def get_text(self, key):
+        """Return the cell's full value, not the shortened text on screen."""
+        return self._texts.get(key, "")
+
+    def place_editor(self, key, editor):
+        """Hide a cell's text and place an edit widget at its position."""
+        item, x, _width = self._cells[key]
+        self._canvas.itemconfigure(item, state="hidden")
+        editor.place(x=x, rely=0.5, anchor="w")
+
+
+class TableRowsBody(ctk.CTkFrame):
+    """Fixed-height frame for a page of rows that only materializes visible rows.
+
+    Rows are placed at precomputed offsets, so the frame keeps its full scroll
+    height while only rows in the visible range (plus a small buffer) exist.
+    Rows leaving the range are hidden and recycled for the next rows shown;
+    rows still in range when a new page is shown stay placed and are rebound.
+    """
+
+    ROW_SPACING = TableRow.HEIGHT + 4
+    BUFFER_ROWS = 2
+
+    def __init__(self, master, build_row, bind_row):
+        super().__init__(master, fg_color="transparent", height=1)
+        self.row_count = 0
+        self.rows = {}
+        self._free_rows = []
+        self._stale = set()
+        self._build_row = build_row
+        self._bind_row = bind_row
+
+    def show_rows(self, row_count):
+        """Start a new page of `row_count` rows; placed rows are rebound, not re-placed."""
+        for index, row in list(self.rows.items()):
+            if index >= row_count or row.editing:
+                self._release_row(index)
+        self._stale = set(self.rows)
+        self.row_count = row_count
+        self.configure(height=max(1, row_count * self.ROW_SPACING))
+
+    def _release_row(self, index):
+        self._stale.discard(index)
+        row = self.rows.pop(index)
+        if row.editing:
+            row.destroy()  # Rows with edit widgets placed are not recycled.
+        else:
+            row.place_forget()
+            self._free_rows.append(row)
+
+    def render_window(self, top, bottom, limit=0, deadline=None):
+        """Show rows intersecting [top, bottom).
+
+        Returns True if `limit` rows were shown or the `deadline` (a
+        time.perf_counter() value) passed before every row was shown.
+        """
+        spacing = self._apply_widget_scaling(self.ROW_SPACING)
+        first = max(0, int(top // spacing) - self.BUFFER_ROWS)
+        last = min(self.row_count, int(bottom // spacing) + 1 + self.BUFFER_ROWS)
+
+        for index in list(self.rows):
+            if not first <= index < last and not self.rows[index].editing:
+                self._release_row(index)
+
+        shown = 0
+        for index in range(first, last):
+            if index in self.rows:
+                if index in self._stale:
+                    self._stale.discard(index)
+                    self._bind_row(self.rows[index], index)
+                continue
+            if (limit and shown >= limit) or (deadline is not None and time.perf_counter() > deadline):
+                return True
+            row = self._free_rows.pop() if self._free_rows else self._build_row(self)
+            self._bind_row(row, index)
+            row.place(x=0, y=index * self.ROW_SPACING + 2, relwidth=1)
+            self.rows[index] = row
+            shown += 1
+        return False
+
 
 class DataTable:
     """Build and manage data tables with optional CRUD behavior."""
 
+    RENDER_DELAY_MS = 16
+    RENDER_BUDGET_MS = 8
+    PAGE_BUTTONS_PER_STEP = 4
+
     def __init__(
         self,
         parent,
@@ -46,6 +279,21 @@ class DataTable:
 
         self.parent = parent
         self.columns = columns
+        self._col_names = [col["name"] for col in columns]
+        self._col_keys = [col["key"] for col in columns]
+        self._col_widths = [col.get("width", 150) for col in columns]
+        self._formatters = [self._make_formatter(col) for col in columns]
+        # (key, format, width, options) for each editable column, read once rather than per edit.
+        self._edit_specs = [
+            (
+                col["key"],
+                col.get("format"),
+                col.get("width", 150),
+                col.get("options", ["True", "False"] if col.get("format") == "boolean" else []),
+            )
+            for col in columns
+            if col.get("editable", True)
+        ]
         self.data = data
         self.editable = editable
         self.deletable = deletable
@@ -63,22 +311,46 @@ class DataTable:
         self.error_label = ctk.CTkLabel(
             self.table_container,
             text="",
-            font=("Arial", 12),
+            font=shared_font(12),
             text_color="red",
             wraplength=600,
         )
 
-        self.content_ref = {"content": None}
+        self.content_ref = {
+            "content": None,
+            "data": [],
+            "page_widgets": [],
+            "page_data": [],
+            "page_columns": [],
+            "rows_body": None,
+            "rendered_page": None,
+            "fingerprint": None,
+        }
         self.pagination_ref = {"page": 1, "total_pages": 1}
+        self._error_visible = False
+        self.pager_ref = {
+            "frame": None,
+            "navigation": False,
+            "prev": None,
+            "next": None,
+            "page_frame": None,
+            "page_buttons": [],
+            "status": None,
+            "fill_id": 0,
+        }
+        self._pending_render_id = None
+        self._pending_reload = False
 
         def refresh_table():
+            # Synchronous, so callers see the new rows as soon as it returns; a pending
+            # batched render is superseded by this one.
+            self._cancel_pending_render()
             self._refresh_table_impl()
 
         self.refresh_table = refresh_table
 
         def _set_page(p: int):
-            self.pagination_ref["page"] = int(p)
-            self.refresh_table()
+            self._set_page(p)
 
         def _reset_page():
             self.pagination_ref["page"] = 1
@@ -86,15 +358,58 @@ class DataTable:
         self.refresh_table.set_page = _set_page  # type: ignore[attr-defined]
         self.refresh_table.reset_page = _reset_page  # type: ignore[attr-defined]
 
-        self.refresh_table()
-
-    def _refresh_table_impl(self):
-        self.error_label.pack_forget()
+        self._refresh_table_impl()
+
+    def schedule_refresh(self):
+        """Reload and re-render on the next frame, merging bursts of requests into one render."""
+        self._schedule_render(reload_data=True)
+
+    def _cancel_pending_render(self):
+        if self._pending_render_id is not None:
+            try:
+                self.table_container.after_cancel(self._pending_render_id)
+            except Exception:
+                pass
+        self._pending_render_id = None
+        self._pending_reload = False
+
+    def _schedule_render(self, reload_data):
+        """Coalesce render requests into one trailing render per frame."""
+        self._pending_reload = self._pending_reload or reload_data
+        if self._pending_render_id is None:
+            self._pending_render_id = self.table_container.after(self.RENDER_DELAY_MS, self._flush_render)
+
+    def _flush_render(self):
+        self._pending_render_id = None
+        reload_data, self._pending_reload = self._pending_reload, False
+        if not self.table_container.winfo_exists():
+            return
 
-        current_data = self.refresh_data() if self.refresh_data else self.data or []
-        total_rows = len(current_data)
+        if reload_data:
+            self._refresh_table_impl()
+        else:
+            self._render_page()
 
-        if self.content_ref["content"] is None:
+    def _refresh_table_impl(self):
+        previous_fingerprint = self.content_ref["fingerprint"]
+        self._reload_data()
+        fingerprint = self.content_ref["fingerprint"] = self._data_fingerprint(self.content_ref["data"])
+
+        if self.content_ref["content"] is not None:
+            rows_body = self.content_ref["rows_body"]
+            editing = any(row.editing for row in rows_body.rows.values())
+            unchanged = (
+                fingerprint is not None
+                and fingerprint == previous_fingerprint
+                and self.pagination_ref["page"] == self.content_ref["rendered_page"]
+            )
+            if unchanged and not editing:
+                # Same values on screen, so only the records behind the shown rows are swapped in;
+                # fields outside the columns (ids and the like) may still have changed.
+                self._rebind_page_records()
+                self._hide_error()
+                return
+        else:
             content = self.scrollable_container(
                 self.table_container,
                 pady=0,
@@ -102,38 +417,118 @@ class DataTable:
                 hide_scrollbar_when_loading=True,
             )
             self.content_ref["content"] = content
-        else:
-            for widget in self.content_ref["content"].winfo_children():
-                widget.destroy()
-            content = self.content_ref["content"]
+            content.add_scroll_listener(self._render_viewport)
+            self._build_header(content)
 
-        header_row = ctk.CTkFrame(content, fg_color=THEME.colors.secondary_gray)
+            rows_body = TableRowsBody(
+                content,
+                build_row=(
+                    self._create_row_widget_with_actions
+                    if self.editable or self.deletable
+                    else self._create_row_widget
+                ),
+                bind_row=self._bind_row,
+            )
+            rows_body.pack(fill="x", padx=5)
+            self.content_ref["rows_body"] = rows_body
+
+        self._render_page()
+
+    def _data_fingerprint(self, data):
+        """Row count plus a hash of the displayed columns, or None if a value is unhashable."""
+        col_keys = self._col_keys
+        try:
+            return len(data), hash(tuple(tuple(row.get(key) for key in col_keys) for row in data))
+        except TypeError:
+            return None
+
+    def _page_bounds(self):
+        if self.page_size > 0:
+            start = (self.pagination_ref["page"] - 1) * self.page_size
+            return start, start + self.page_size
+        return 0, len(self.content_ref["data"])
+
+    def _rebind_page_records(self):
+        start, end = self._page_bounds()
+        page_data = self.content_ref["page_data"] = self.content_ref["data"][start:end]
+        for index, row in self.content_ref["rows_body"].rows.items():
+            row.row_data = page_data[index]
+
+    def update_row(self, index, row_data):
+        """Replace the record at index in the table data and redraw just that row if it is shown."""
+        self.content_ref["data"][index] = row_data
+        # The next refresh compares against the source again rather than this local edit.
+        self.content_ref["fingerprint"] = None
+        if self.content_ref["content"] is None:
+            return
+
+        start, end = self._page_bounds()
+        if not start <= index < end:
+            return
+        local_index = index - start
+        self.content_ref["page_data"][local_index] = row_data
+        for column, key, formatter in zip(self.content_ref["page_columns"], self._col_keys, self._formatters):
+            column[local_index] = formatter(row_data.get(key, ""))
+        row = self.content_ref["rows_body"].rows.get(local_index)
+        if row is not None and not row.editing:
+            self._bind_row(row, local_index)
+
+    def _set_page(self, page: int):
+        """Switch page by re-rendering the cached data; the data source is not re-queried."""
+        self.pagination_ref["page"] = int(page)
+        self._schedule_render(reload_data=False)
+
+    def _reload_data(self):
+        self.content_ref["data"] = self.refresh_data() if self.refresh_data else self.data or []
+
+    def _build_header(self, content):
+        header_row = TableHeaderRow(content, fg_color=THEME.colors.secondary_gray)
         header_row.pack(fill="x", padx=5, pady=(5, 0))
 
-        for col in self.columns:
-            col_width = col.get("width", 150)
+        has_actions = self.editable or self.deletable
+        last_index = len(self._col_names) - 1
+        for index, (col_name, col_width) in enumerate(zip(self._col_names, self._col_widths)):
             header_cell = ctk.CTkLabel(
                 header_row,
-                text=col["name"],
+                text=col_name,
                 width=col_width - 10,
-                font=("Arial", 13, "bold"),
+                font=shared_font(13, "bold"),
                 anchor="w",
             )
-            header_cell.pack(side="left", padx=5, pady=8)
-            if col != self.columns[-1]:
-                vertical_divider(header_row, padx=(0, 8))
+            if index != last_index or has_actions:
+                header_cell.pack(side="left", padx=(5, 5 + TableHeaderRow.DIVIDER_SPACE), pady=8)
+                header_row.add_divider_after(header_cell)
+            else:
+                header_cell.pack(side="left", padx=5, pady=8)
 
-        if self.editable or self.deletable:
-            vertical_divider(header_row, padx=(0, 8))
+        if has_actions:
             ctk.CTkLabel(
                 header_row,
                 text="Actions",
                 width=120,
-                font=("Arial", 13, "bold"),
+                font=shared_font(13, "bold"),
                 anchor="center",
             ).pack(side="right", padx=5, pady=8)
 
+    def _clear_page_widgets(self):
+        for widget in self.content_ref["page_widgets"]:
+            widget.destroy()
+        self.content_ref["page_widgets"] = []
+
+    def _render_page(self):
+        """Render the current page slice below the persistent header."""
+        self._hide_error()
+        self._clear_page_widgets()
+        page_widgets = self.content_ref["page_widgets"]
+
+        content = self.content_ref["content"]
+        current_data = self.content_ref["data"]
+        total_rows = len(current_data)
+
         if total_rows == 0:
+            self.content_ref["rows_body"].show_rows(0)
+            if self.pager_ref["frame"] is not None:
+                self.pager_ref["frame"].pack_forget()
             empty_label = ctk.CTkLabel(
                 content,
                 text="No data available",
@@ -141,6 +536,7 @@ class DataTable:
                 text_color=THEME.colors.disabled_text,
             )
             empty_label.pack(pady=20)
+            page_widgets.append(empty_label)
             return
 
         if self.page_size > 0:
@@ -155,306 +551,319 @@ class DataTable:
             self.pagination_ref["page"] = 1
             page_data = current_data
 
-        batch_size = self.render_batch_size if self.render_batch_size > 0 else 0
-
-        loading_label = None
-        if batch_size and len(page_data) > batch_size:
-            loading_label = ctk.CTkLabel(
-                content,
-                text=f"Loading {len(page_data)} rows...",
-                font=("Arial", 12),
-                text_color=THEME.colors.text,
+        self.content_ref["page_data"] = page_data
+        self.content_ref["rendered_page"] = self.pagination_ref["page"]
+        # Formatted once per page into per-column lists, so binding a row (again on every scroll back
+        # into view) is plain indexing with no dict lookups or formatting.
+        self.content_ref["page_columns"] = [
+            [formatter(row.get(key, "")) for row in page_data]
+            for key, formatter in zip(self._col_keys, self._formatters)
+        ]
+        self.content_ref["rows_body"].show_rows(len(page_data))
+
+        self._update_pager(total_rows)
+        self._render_viewport()
+        self.table_container.after_idle(self._render_viewport)
+
+    def _update_pager(self, total_rows):
+        """Show the pager below the rows, reusing its widgets across renders."""
+        pager_ref = self.pager_ref
+        has_page_navigation = self.page_size > 0 and total_rows > self.page_size
+        if pager_ref["frame"] is not None and pager_ref["navigation"] != has_page_navigation:
+            pager_ref["frame"].destroy()
+            pager_ref.update(frame=None, page_buttons=[])
+
+        if not (has_page_navigation or self.show_refresh_button):
+            return
+        if pager_ref["frame"] is None:
+            self._build_pager(has_page_navigation)
+
+        if has_page_navigation:
+            cur = self.pagination_ref["page"]
+            total = self.pagination_ref["total_pages"]
+            pager_ref["prev"].configure(
+                command=partial(self._set_page, max(1, cur - 1)),
+                state="normal" if cur > 1 else "disabled",
             )
-            loading_label.pack(anchor="w", padx=5, pady=(8, 2))
+            pager_ref["next"].configure(
+                command=partial(self._set_page, min(total, cur + 1)),
+                state="normal" if cur < total else "disabled",
+            )
+            pager_ref["status"].configure(text=f"Page {cur} / {total} ({total_rows} rows)")
+            self._fill_page_buttons(cur, total)
 
-        def finalize_controls():
-            if loading_label:
-                loading_label.destroy()
+        if not pager_ref["frame"].winfo_manager():
+            pager_ref["frame"].pack(fill="x", pady=(10, 0), padx=5)
 
-            pager = None
-            has_page_navigation = self.page_size > 0 and total_rows > self.page_size
-            
-            if has_page_navigation or self.show_refresh_button:
-                pager = ctk.CTkFrame(content, fg_color="transparent")
-                pager.pack(fill="x", pady=(10, 0), padx=5)
+    def _build_pager(self, has_page_navigation):
+        pager = ctk.CTkFrame(self.content_ref["content"], fg_color="transparent")
+        self.pager_ref.update(frame=pager, navigation=has_page_navigation, page_buttons=[])
 
-            if has_page_navigation:
+        if has_page_navigation:
+            prev_btn = ctk.CTkButton(pager, text="← Prev", width=90, **_PAGER_BUTTON_STYLE)
+            prev_btn.pack(side="left")
 
-                def set_page(p: int):
-                    self.pagination_ref["page"] = p
-                    self.refresh_table()
-
-                prev_btn = ctk.CTkButton(
-                    pager,
-                    text="← Prev",
-                    width=90,
-                    height=32,
-                    command=lambda: set_page(max(1, self.pagination_ref["page"] - 1)),
-                    state="normal" if self.pagination_ref["page"] > 1 else "disabled",
-                    fg_color=THEME.colors.secondary_gray,
-                    hover_color=THEME.colors.secondary_gray_hover,
-                    text_color=THEME.colors.text,
-                    text_color_disabled=THEME.colors.disabled_text,
-                )
-                prev_btn.pack(side="left")
-
-                page_btn_frame = ctk.CTkFrame(pager, fg_color="transparent")
-                page_btn_frame.pack(side="left", padx=10)
-
-                cur = self.pagination_ref["page"]
-                total = self.pagination_ref["total_pages"]
-
-                def add_page_button(label, page_num=None, disabled=False):
-                    btn = ctk.CTkButton(
-                        page_btn_frame,
-                        text=str(label),
-                        width=38,
-                        height=32,
-                        command=(lambda p=page_num: set_page(p)) if page_num else None,
-                        state="disabled" if disabled else "normal",
-                        fg_color=THEME.colors.secondary_gray,
-                        hover_color=THEME.colors.secondary_gray_hover,
-                        text_color=THEME.colors.text,
-                        text_color_disabled=THEME.colors.disabled_text,
-                    )
-                    btn.pack(side="left", padx=2)
+            page_btn_frame = ctk.CTkFrame(pager, fg_color="transparent")
+            page_btn_frame.pack(side="left", padx=10)
 
-                window = 2
-                pages = [1]
-                for p in range(max(2, cur - window), min(total, cur + window) + 1):
-                    pages.append(p)
-                if total not in pages:
-                    pages.append(total)
-
-                last = None
-                for p in pages:
-                    if last is not None and p - last > 1:
-                        add_page_button("...", disabled=True)
-                    add_page_button(p, page_num=p, disabled=(p == cur))
-                    last = p
-
-                next_btn = ctk.CTkButton(
-                    pager,
-                    text="Next →",
-                    width=90,
-                    height=32,
-                    command=lambda: set_page(min(total, self.pagination_ref["page"] + 1)),
-                    state="normal" if self.pagination_ref["page"] < total else "disabled",
-                    fg_color=THEME.colors.secondary_gray,
-                    hover_color=THEME.colors.secondary_gray_hover,
-                    text_color=THEME.colors.text,
-                    text_color_disabled=THEME.colors.disabled_text,
-                )
-                next_btn.pack(side="left", padx=(10, 0))
-
-                ctk.CTkLabel(
-                    pager,
-                    text=f"Page {cur} / {total} ({total_rows} rows)",
-                    font=("Arial", 12),
-                    text_color=THEME.colors.text,
-                ).pack(side="right")
-
-            if self.show_refresh_button and pager is not None:
-                refresh_btn = create_refresh_button(
-                    pager,
-                    self.refresh_table,
-                    padx=25 if has_page_navigation else 0,
-                )
-                if has_page_navigation:
-                    refresh_btn.pack_configure(side="left")
-                else:
-                    refresh_btn.pack_configure(side="top", anchor="center")
-
-        def render_rows_range(start_idx: int):
-            end_idx = len(page_data) if not batch_size else min(start_idx + batch_size, len(page_data))
-            for row_data in page_data[start_idx:end_idx]:
-                self._create_row_widget(
-                    parent_widget=content,
-                    row_data=row_data,
-                )
+            next_btn = ctk.CTkButton(pager, text="Next →", width=90, **_PAGER_BUTTON_STYLE)
+            next_btn.pack(side="left", padx=(10, 0))
+
+            status_label = ctk.CTkLabel(pager, text="", font=shared_font(12), text_color=THEME.colors.text)
+            status_label.pack(side="right")
+
+            self.pager_ref.update(prev=prev_btn, next=next_btn, page_frame=page_btn_frame, status=status_label)
 
-            if end_idx < len(page_data):
-                self.table_container.after(1, lambda: render_rows_range(end_idx))
+        if self.show_refresh_button:
+            refresh_btn = create_refresh_button(
+                pager,
+                self.refresh_table,
+                padx=25 if has_page_navigation else 0,
+            )
+            if has_page_navigation:
+                refresh_btn.pack_configure(side="left")
             else:
-                finalize_controls()
+                refresh_btn.pack_configure(side="top", anchor="center")
+
+    def _fill_page_buttons(self, cur, total):
+        """Point the pooled page buttons at the pages around `cur`, creating missing ones in chunks."""
+        pager_ref = self.pager_ref
+        page_btn_frame = pager_ref["page_frame"]
+        buttons = pager_ref["page_buttons"]
+        entries = self._page_entries(cur, total)
+        pager_ref["fill_id"] += 1
+        fill_id = pager_ref["fill_id"]
+
+        for btn in buttons[len(entries):]:
+            btn.pack_forget()
+
+        def fill(start):
+            # A few buttons per event-loop turn so a long pager never stalls a frame.
+            if fill_id != pager_ref["fill_id"] or not page_btn_frame.winfo_exists():
+                return
+            stop = min(len(entries), start + self.PAGE_BUTTONS_PER_STEP)
+            for index in range(start, stop):
+                label, page_num, disabled = entries[index]
+                if index == len(buttons):
+                    buttons.append(ctk.CTkButton(page_btn_frame, width=38, **_PAGER_BUTTON_STYLE))
+                btn = buttons[index]
+                btn.configure(
+                    text=str(label),
+                    command=partial(self._set_page, page_num) if page_num else None,
+                    state="disabled" if disabled else "normal",
+                )
+                if not btn.winfo_manager():
+                    btn.pack(side="left", padx=2)
+            if stop < len(entries):
+                page_btn_frame.after(0, fill, stop)
 
-        if batch_size:
-            render_rows_range(0)
-        else:
-            for row_data in page_data:
-                self._create_row_widget(parent_widget=content, row_data=row_data)
-            finalize_controls()
+        fill(0)
 
-    def _create_row_widget(self, parent_widget, row_data):
-        row = ctk.CTkFrame(parent_widget, fg_color="transparent")
-        row.pack(fill="x", padx=5, pady=2)
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _page_entries(cur, total, window=2):
+        """Return (label, page_num, disabled) for each pager button, with "..." gaps."""
+        # Only the first, last and a window around the current page are shown.
+        pages = sorted({1, total, *range(max(1, cur - window), min(total, cur + window) + 1)})
+
+        entries = []
+        last = None
+        for p in pages:
+            if last is not None and p - last > 1:
+                entries.append(("...", None, True))
+            entries.append((p, p, p == cur))
+            last = p
+        return tuple(entries)
+
+    def _render_viewport(self):
+        """Materialize the rows of the current page that intersect the visible region."""
+        rows_body = self.content_ref["rows_body"]
+        if not rows_body.row_count or not rows_body.winfo_exists():
+            return
 
-        cell_widgets = {}
+        top, bottom = self.content_ref["content"].visible_region()
+        offset = rows_body.winfo_y()
+        deadline = time.perf_counter() + self.RENDER_BUDGET_MS / 1000
+        has_more = rows_body.render_window(
+            top - offset, bottom - offset, limit=self.render_batch_size, deadline=deadline
+        )
+        if has_more:
+            self.table_container.after_idle(self._render_viewport)
+
+    def _create_row_widget(self, parent_widget):
+        """Build an unbound row; `_bind_row` fills it with data each time it is shown."""
+        return TableRow(parent_widget, self._col_keys, self._col_widths)
+
+    def _create_row_widget_with_actions(self, parent_widget):
+        """Build an unbound row with its Edit/Delete action buttons."""
+        row = self._create_row_widget(parent_widget)
+        action_frame = ctk.CTkFrame(row, fg_color="transparent")
+        action_frame.pack(side="right", padx=5, pady=5)
+
+        if self.editable:
+            edit_btn = ctk.CTkButton(
+                action_frame,
+                text="Edit",
+                width=50,
+                height=28,
+                command=partial(self._edit_row, row),
+                **_SECONDARY_BUTTON_COLORS,
+            )
+            edit_btn.pack(side="left", padx=2)
+            row.edit_btn = edit_btn
+
+        if self.deletable:
+            delete_btn = ctk.CTkButton(
+                action_frame,
+                text="Delete",
+                width=60,
+                height=28,
+                command=partial(self._delete_row, row),
+                fg_color=("red", "darkred"),
+                hover_color=("darkred", "red"),
+            )
+            delete_btn.pack(side="left", padx=2)
+            row.delete_btn = delete_btn
 
-        for col in self.columns:
-            col_width = col.get("width", 150)
-            col_key = col["key"]
-            col_editable = col.get("editable", True)
-            raw_value = row_data.get(col_key, "")
+        return row
 
-            value = raw_value
-            col_format = col.get("format")
-            if col_format == "currency":
-                value = input_validation.format_currency_display(raw_value)
-            elif col_format == "boolean":
-                options = col.get("options", ["True", "False"])
+    @staticmethod
+    def _make_formatter(col):
+        """Return a callable turning a raw cell value into its display text."""
+        col_format = col.get("format")
+        if col_format == "currency":
+            return _format_currency
+
+        if col_format == "boolean":
+            options = col.get("options", ["True", "False"])
+            # The stored flag values (1/0, True/False, "1"/"0") resolve with one dict lookup;
+            # anything else falls back to the int() coercion.
+            labels = {1: options[0], 0: options[1], "1": options[0], "0": options[1]} if len(options) > 1 else {}
+
+            def format_boolean(raw_value):
+                try:
+                    return labels[raw_value]
+                except (KeyError, TypeError):
+                    pass
                 try:
-                    value = options[0] if int(raw_value) == 1 else options[1]
+                    return options[0] if int(raw_value) == 1 else options[1]
                 except (ValueError, TypeError, IndexError):
-                    value = str(raw_value)
-            else:
-                value = str(raw_value)
-                if col.get("prefix") and value:
-                    value = f"{col['prefix']}{value}"
-                if col.get("suffix") and value:
-                    value = f"{value}{col['suffix']}"
-
-            cell_frame = ctk.CTkFrame(row, fg_color="transparent")
-            cell_frame.pack(side="left", padx=5, pady=5)
-
-            cell_label = ctk.CTkLabel(
-                cell_frame,
-                text=value,
-                width=col_width,
-                anchor="w",
-                font=("Arial", 12),
-            )
-            cell_label.pack()
+                    return str(raw_value)
 
-            cell_widgets[col_key] = {"label": cell_label, "editable": col_editable}
+            return format_boolean
 
-        if self.editable or self.deletable:
-            action_frame = ctk.CTkFrame(row, fg_color="transparent")
-            action_frame.pack(side="right", padx=5)
+        prefix = col.get("prefix") or ""
+        suffix = col.get("suffix") or ""
+        if not prefix and not suffix:
+            return str
 
-            if self.editable:
-                edit_btn = ctk.CTkButton(
-                    action_frame,
-                    text="Edit",
-                    width=50,
+        def format_text(raw_value):
+            value = str(raw_value)
+            return f"{prefix}{value}{suffix}" if value else value
+
+        return format_text
+
+    def _bind_row(self, row, index):
+        row.row_data = self.content_ref["page_data"][index]
+        for col_key, values in zip(self._col_keys, self.content_ref["page_columns"]):
+            row.set_text(col_key, values[index])
+
+    def _edit_row(self, row):
+        self._hide_error()
+        row_data = row.row_data
+        row.editing = True
+        edit_data = {}
+
+        for col_key, col_format, col_width, options in self._edit_specs:
+            if col_format == "currency":
+                # Edit from the raw amount rather than re-parsing the "£1,234.56" display text.
+                raw_value = row_data.get(col_key)
+                if isinstance(raw_value, (int, float)):
+                    current_value = f"{raw_value:.2f}"
+                else:
+                    current_value = "" if raw_value is None else str(raw_value)
+            else:
+                current_value = row.get_text(col_key)
+
+            if col_format == "dropdown":
+                dropdown = ctk.CTkOptionMenu(
+                    row,
+                    values=options if options else ["No options"],
+                    width=col_width,
                     height=28,
-                    command=lambda: self._edit_row(row_data, cell_widgets),
-                    fg_color=THEME.colors.secondary_gray,
-                    hover_color=THEME.colors.secondary_gray_hover,
-                    text_color=THEME.colors.text,
+                    font=shared_font(12),
                 )
-                edit_btn.pack(side="left", padx=2)
 
-            if self.deletable:
-                delete_btn = ctk.CTkButton(
-                    action_frame,
-                    text="Delete",
-                    width=60,
+                if current_value and options and current_value in options:
+                    dropdown.set(current_value)
+                elif options:
+                    dropdown.set(options[0])
+
+                row.place_editor(col_key, dropdown)
+                edit_data[col_key] = dropdown
+
+            elif col_format == "boolean":
+                dropdown = ctk.CTkOptionMenu(
+                    row,
+                    values=options,
+                    width=col_width,
                     height=28,
-                    command=lambda: self._delete_row(row_data),
-                    fg_color=("red", "darkred"),
-                    hover_color=("darkred", "red"),
+                    font=shared_font(12),
                 )
-                delete_btn.pack(side="left", padx=2)
+                if current_value in options:
+                    dropdown.set(current_value)
+                else:
+                    dropdown.set(options[0])
+                row.place_editor(col_key, dropdown)
+                edit_data[col_key] = {"widget": dropdown, "boolean_options": options}
 
-    def _edit_row(self, row_data, cell_widgets):
-        self.error_label.pack_forget()
-        edit_data = {}
+            else:
+                entry = ctk.CTkEntry(
+                    row,
+                    width=col_width,
+                    font=shared_font(12),
+                )
 
-        for col in self.columns:
-            col_key = col["key"]
-            if col_key in cell_widgets and cell_widgets[col_key]["editable"]:
-                widget_info = cell_widgets[col_key]
-                label = widget_info["label"]
-                current_value = label.cget("text")
-                col_format = col.get("format")
-
-                if col_format == "currency" and isinstance(current_value, str):
-                    current_value = input_validation.strip_currency_formatting(current_value)
-
-                label.pack_forget()
-
-                if col_format == "dropdown":
-                    options = col.get("options", [])
-                    dropdown = ctk.CTkOptionMenu(
-                        label.master,
-                        values=options if options else ["No options"],
-                        width=col.get("width", 150),
-                        height=28,
-                        font=("Arial", 12),
+                placeholder = "YYYY-MM-DD" if col_format == "date" else None
+                validator = _ENTRY_VALIDATORS.get(col_format)
+                if validator is not None:
+                    entry.configure(
+                        validate="key",
+                        validatecommand=input_validation.validator_command(entry, validator, placeholder),
                     )
+                if placeholder:
+                    entry.configure(placeholder_text=placeholder)
 
-                    if current_value and options and current_value in options:
-                        dropdown.set(current_value)
-                    elif options:
-                        dropdown.set(options[0])
-
-                    dropdown.pack()
-                    edit_data[col_key] = dropdown
-
-                elif col_format == "boolean":
-                    options = col.get("options", ["True", "False"])
+                entry.insert(0, current_value)
+                row.place_editor(col_key, entry)
+                edit_data[col_key] = entry
 
-                    dropdown = ctk.CTkOptionMenu(
-                        label.master,
-                        values=options,
-                        width=col.get("width", 150),
-                        height=28,
-                        font=("Arial", 12),
-                    )
-                    if current_value in options:
-                        dropdown.set(current_value)
-                    else:
-                        dropdown.set(options[0])
-                    dropdown.pack()
-                    edit_data[col_key] = {"widget": dropdown, "boolean_options": options}
+        if row.edit_btn is not None:
+            row.edit_btn.configure(
+                text="Save",
+                command=partial(self._save_row, row_data, edit_data),
+            )
+        if row.delete_btn is not None:
+            row.delete_btn.configure(
+                text="Cancel",
+                command=self._render_page,
+                **_SECONDARY_BUTTON_COLORS,
+            )
 
-                else:
-                    entry = ctk.CTkEntry(
-                        label.master,
-                        width=col.get("width", 150),
-                        font=("Arial", 12),
-                    )
+    def _show_error(self, message):
+        self.error_label.configure(text=message)
+        if not self._error_visible:
+            self.error_label.pack(fill="x", padx=10, pady=(5, 0))
+            self._error_visible = True
 
-                    if col_format == "number":
-                        vcmd = (entry.register(input_validation.validate_number_input), "%P")
-                        entry.configure(validate="key", validatecommand=vcmd)
-                    elif col_format == "currency":
-                        vcmd = (entry.register(input_validation.validate_currency_input), "%P")
-                        entry.configure(validate="key", validatecommand=vcmd)
-                    elif col_format == "date":
-                        vcmd = (entry.register(input_validation.validate_date_input), "%P")
-                        entry.configure(validate="key", validatecommand=vcmd)
-                        entry.configure(placeholder_text="YYYY-MM-DD")
-
-                    entry.insert(0, current_value)
-                    entry.pack()
-                    edit_data[col_key] = entry
-
-        if cell_widgets:
-            first_cell = list(cell_widgets.values())[0]
-            button_frame = first_cell["label"].master.master
-
-            for widget in button_frame.winfo_children():
-                if isinstance(widget, ctk.CTkFrame):
-                    for btn in widget.winfo_children():
-                        if isinstance(btn, ctk.CTkButton):
-                            if btn.cget("text") == "Edit":
-                                btn.configure(
-                                    text="Save",
-                                    command=lambda: self._save_row(row_data, edit_data),
-                                )
-                            elif btn.cget("text") == "Delete":
-                                btn.configure(
-                                    text="Cancel",
-                                    command=lambda: self.refresh_table(),
-                                    fg_color=THEME.colors.secondary_gray,
-                                    hover_color=THEME.colors.secondary_gray_hover,
-                                    text_color=THEME.colors.text,
-                                )
+    def _hide_error(self):
+        # Most renders and edits happen with no error showing; skip the Tk call then.
+        if self._error_visible:
+            self.error_label.pack_forget()
+            self._error_visible = False
 
     def _save_row(self, row_data, edit_data):
-        self.error_label.pack_forget()
+        self._hide_error()
         updated_data = {}
         for key, item in edit_data.items():
             if isinstance(item, dict) and "widget" in item:
@@ -480,11 +889,11 @@ class DataTable:
                 self.refresh_table()
             else:
                 error_message = str(result) if result else "Update failed"
-                self.error_label.configure(text=f"Update failed: {error_message}")
-                self.error_label.pack(fill="x", padx=10, pady=(5, 0))
+                self._show_error(f"Update failed: {error_message}")
 
-    def _delete_row(self, row_data):
-        self.error_label.pack_forget()
+    def _delete_row(self, row):
+        self._hide_error()
+        row_data = row.row_data
 
         if self.on_delete:
             result = self.on_delete(row_data)
@@ -492,8 +901,7 @@ class DataTable:
                 self.refresh_table()
             else:
                 error_message = str(result) if result else "Delete failed"
-                self.error_label.configure(text=f"Delete failed: {error_message}")
-                self.error_label.pack(fill="x", padx=10, pady=(5, 0))
+                self._show_error(f"Delete failed: {error_message}")
 
 
 class TablePopupWithHeader:
@@ -578,7 +986,7 @@ class TablePopupWithHeader:
                     self.table.refresh_table.reset_page()
                 self.table.refresh_table()
 
-            self._refresh_timer, schedule_refresh = create_debounced_refresh(
+            schedule_refresh = create_debounced_refresh(
                 popup_content,
                 refresh_with_reset,
             )
@@ -1,10 +1,22 @@
 """Contributors: Aaron Antal-Bento (23013693)"""
 
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image
 import customtkinter as ctk
 from models.user import User
 
+
+@lru_cache(maxsize=1)
+def _load_theme_icons(icons_dir):
+    """Decode the light and dark theme icons once; later HomePages reuse them."""
+    light_image = Image.open(icons_dir / "light_icon.png")
+    dark_image = Image.open(icons_dir / "dark_icon.png")
+    light_image.load()
+    dark_image.load()
+    return light_image, dark_image
+
+
 class HomePage(ctk.CTkFrame):
     def __init__(self, parent, controller, user : User):
         super().__init__(parent, fg_color="transparent")
@@ -17,9 +29,10 @@ class HomePage(ctk.CTkFrame):
         icons_dir = here.parent / "icons"  # paragonapartments/icons
 
         # Load theme icons for light and dark modes
+        light_image, dark_image = _load_theme_icons(icons_dir)
         self.theme_icon = ctk.CTkImage(
-            light_image=Image.open(icons_dir / "light_icon.png"),
-            dark_image=Image.open(icons_dir / "dark_icon.png"),
+            light_image=light_image,
+            dark_image=dark_image,
             size=(50, 27.5)
         )
 